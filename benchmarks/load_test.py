@@ -0,0 +1,251 @@
+# python -m benchmarks.load_test --operations 5000 --output load.json
+# python -m benchmarks.load_test --operations 5000 --baseline load.json --threshold 20
+
+import argparse
+import contextlib
+import io
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Callable
+
+from buffer.buffer import Buffer
+from cipher.cipher import CipherFacade
+from files_service.file_handler import FileHandler
+from manager.manager import Manager
+from menu.menu_items import MainMenu
+
+from .runner import compare_results, load_results, save_results
+
+# Relative frequency of the menu actions in a generated session.
+OPERATION_WEIGHTS = {
+    "encrypt": 45,
+    "decrypt": 35,
+    "save": 12,
+    "display": 2,
+    "load": 1,
+    "clear": 1,
+}
+CIPHER_TYPES = ["rot13", "rot47", "vigenere:lemon", "xor:secret", "rot47+rot13"]
+WORDS = ["hello", "world", "secret", "message", "cipher", "Zażółć", "Straße", "42"]
+SESSION_FILES = 3
+
+
+def build_script(operations: int, seed: int, directory: str) -> list[str]:
+    """Generate the input lines of a menu session with `operations` actions.
+
+    The script follows the prompts of Manager: saving an empty buffer asks
+    for nothing, and only files saved earlier in the session are loaded.
+    The session always ends with the Exit choice."""
+
+    rng = random.Random(seed)
+    names, weights = zip(*OPERATION_WEIGHTS.items())
+    filenames = [
+        os.path.join(directory, f"session-{i}.json") for i in range(SESSION_FILES)
+    ]
+    saved_files: list[str] = []
+    buffer_empty = True
+    lines = []
+
+    for _ in range(operations):
+        operation = rng.choices(names, weights)[0]
+
+        if operation in ["encrypt", "decrypt"]:
+            text = " ".join(rng.choices(WORDS, k=rng.randint(1, 8)))
+            choice = "1" if operation == "encrypt" else "2"
+            lines += [choice, text, rng.choice(CIPHER_TYPES)]
+            buffer_empty = False
+        elif operation == "save":
+            lines.append("5")
+            if not buffer_empty:
+                filename = rng.choice(filenames)
+                lines += [filename, rng.choice(["w", "a"])]
+                if filename not in saved_files:
+                    saved_files.append(filename)
+        elif operation == "load" and saved_files:
+            lines += ["6", rng.choice(saved_files)]
+            buffer_empty = False
+        elif operation == "display":
+            lines.append("3")
+        elif operation == "clear":
+            lines.append("4")
+            buffer_empty = True
+
+    lines.append("7")
+    return lines
+
+
+class ActionRecorder:
+    """Times Manager actions, used in place of the ActionProfiler."""
+
+    def __init__(self, buffer: Buffer) -> None:
+        self.buffer = buffer
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.buffer_sizes: list[int] = []
+
+    def run(self, action: Callable[[], None]) -> None:
+        start = time.perf_counter()
+        action()
+        self.latencies[action.__name__].append(time.perf_counter() - start)
+        self.buffer_sizes.append(len(self.buffer.storage))
+
+
+@dataclass
+class LoadTestReport:
+    """Per-action latencies, buffer growth and file sizes of a session."""
+
+    operations: int
+    seconds: float
+    latencies: dict[str, list[float]] = field(default_factory=dict)
+    buffer_sizes: list[int] = field(default_factory=list)
+    file_sizes: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def loop_overhead(self) -> float:
+        """Average time per menu loop spent outside the actions."""
+
+        action_time = sum(sum(values) for values in self.latencies.values())
+        return (self.seconds - action_time) / max(self.operations, 1)
+
+    def action_stats(self) -> dict[str, dict[str, float]]:
+        """Latency statistics of every action in seconds."""
+
+        stats = {}
+        for action, values in sorted(self.latencies.items()):
+            ordered = sorted(values)
+            stats[action] = {
+                "count": len(values),
+                "mean": statistics.fmean(values),
+                "p50": ordered[len(ordered) // 2],
+                "p95": ordered[int(len(ordered) * 0.95)],
+                "max": ordered[-1],
+            }
+        return stats
+
+    def to_results(self) -> dict:
+        """Results in the format of benchmarks.runner.
+
+        `best` holds the median latency, which is what gets compared with
+        the baseline."""
+
+        results = {
+            f"load.{action}": {"best": stats["p50"], **stats}
+            for action, stats in self.action_stats().items()
+        }
+        results["load.loop_overhead"] = {"best": self.loop_overhead}
+
+        return {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "operations": self.operations,
+            "seconds": self.seconds,
+            "max_buffer_size": max(self.buffer_sizes, default=0),
+            "file_sizes": self.file_sizes,
+            "results": results,
+        }
+
+    def display(self) -> None:
+        """Display the latencies, buffer growth and file sizes."""
+
+        print(f"{'action':<16}{'count':>8}{'p50 ms':>12}{'p95 ms':>12}{'max ms':>12}")
+        for action, stats in self.action_stats().items():
+            print(
+                f"{action:<16}{stats['count']:>8}"
+                f"{stats['p50'] * 1000:>12.3f}{stats['p95'] * 1000:>12.3f}"
+                f"{stats['max'] * 1000:>12.3f}"
+            )
+
+        print(f"Loop overhead: {self.loop_overhead * 1_000_000:.1f} us per action")
+        print(
+            f"Buffer size: max {max(self.buffer_sizes, default=0)}, "
+            f"final {self.buffer_sizes[-1] if self.buffer_sizes else 0}"
+        )
+        for filename, size in sorted(self.file_sizes.items()):
+            print(f"File {filename}: {size} B")
+        print(f"{self.operations} actions in {self.seconds:.2f} s")
+
+
+def run_load_test(
+    operations: int = 1000, seed: int = 0, directory: str | None = None
+) -> LoadTestReport:
+    """Run a scripted menu session against a real Manager.
+
+    The script is fed through stdin, so the real menu and input prompts are
+    exercised; the printed output is discarded. Without a directory the
+    files are saved to a temporary one that is removed afterwards."""
+
+    if directory is None:
+        with tempfile.TemporaryDirectory(prefix="cipher-load-") as directory:
+            return run_load_test(operations, seed, directory)
+
+    script = build_script(operations, seed, directory)
+
+    buffer = Buffer()
+    recorder = ActionRecorder(buffer)
+    manager = Manager(CipherFacade(), buffer, FileHandler(), MainMenu(), recorder)
+
+    stdin = sys.stdin
+    sys.stdin = io.StringIO("\n".join(script) + "\n")
+    try:
+        with open(os.devnull, mode="w") as devnull:
+            with contextlib.redirect_stdout(devnull):
+                start = time.perf_counter()
+                manager.run()
+                seconds = time.perf_counter() - start
+    finally:
+        sys.stdin = stdin
+
+    file_sizes = {
+        os.path.basename(entry.path): entry.stat().st_size
+        for entry in os.scandir(directory)
+        if entry.name.endswith(".json")
+    }
+    return LoadTestReport(
+        operations=sum(len(values) for values in recorder.latencies.values()),
+        seconds=seconds,
+        latencies=dict(recorder.latencies),
+        buffer_sizes=recorder.buffer_sizes,
+        file_sizes=file_sizes,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Project Cipher menu load test")
+    parser.add_argument("--operations", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--directory", help="Directory for the saved files")
+    parser.add_argument("--output", help="Save results to a JSON file")
+    parser.add_argument("--baseline", help="Compare with a saved JSON file")
+    parser.add_argument(
+        "--threshold", type=float, default=25.0, help="Allowed slowdown in percent"
+    )
+    args = parser.parse_args(argv)
+
+    report = run_load_test(args.operations, args.seed, args.directory)
+    report.display()
+    results = report.to_results()
+
+    if args.output:
+        save_results(results, args.output)
+
+    if args.baseline:
+        regressions = compare_results(
+            results, load_results(args.baseline), args.threshold
+        )
+        for name, slowdown in regressions:
+            print(f"REGRESSION {name}: {slowdown:.1f}% slower than baseline")
+        if regressions:
+            return 1
+        print(f"No regressions above {args.threshold}%.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
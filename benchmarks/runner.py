@@ -0,0 +1,134 @@
+# python -m benchmarks.runner run --output baseline.json
+# python -m benchmarks.runner compare baseline.json --threshold 10
+
+import argparse
+import fnmatch
+import json
+import platform
+import sys
+import timeit
+
+from .suite import Benchmark, QUICK_SIZES, build_suite
+
+
+def measure(benchmark: Benchmark, repeat: int = 5) -> dict[str, float]:
+    """Time a single benchmark and return its statistics in seconds per call."""
+
+    try:
+        timer = timeit.Timer(benchmark.setup())
+        number, _ = timer.autorange()
+        timings = [
+            total / number for total in timer.repeat(repeat=repeat, number=number)
+        ]
+    finally:
+        if benchmark.teardown:
+            benchmark.teardown()
+
+    best = min(timings)
+    return {
+        "best": best,
+        "mean": sum(timings) / len(timings),
+        "size": benchmark.size,
+        "items_per_sec": benchmark.size / best if best else 0.0,
+    }
+
+
+def run_benchmarks(
+    benchmarks: dict[str, Benchmark], pattern: str = "*", repeat: int = 5
+) -> dict:
+    """Run all benchmarks matching the pattern and collect the results."""
+
+    results = {}
+    for name, benchmark in benchmarks.items():
+        if fnmatch.fnmatch(name, pattern):
+            results[name] = measure(benchmark, repeat=repeat)
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare_results(
+    current: dict, baseline: dict, threshold: float
+) -> list[tuple[str, float]]:
+    """Return benchmarks that got more than `threshold` percent slower.
+
+    Benchmarks that only exist in one of the result sets are ignored."""
+
+    regressions = []
+    for name, result in current["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None or not reference["best"]:
+            continue
+
+        slowdown = (result["best"] / reference["best"] - 1) * 100
+        if slowdown > threshold:
+            regressions.append((name, slowdown))
+
+    return regressions
+
+
+def load_results(filename: str) -> dict:
+    with open(filename, mode="r", encoding="utf-8") as infile:
+        return json.load(infile)
+
+
+def save_results(results: dict, filename: str) -> None:
+    with open(filename, mode="w", encoding="utf-8") as outfile:
+        json.dump(results, outfile, indent=4)
+
+
+def print_results(results: dict) -> None:
+    for name, result in results["results"].items():
+        print(
+            f"{name:<45} best {result['best'] * 1000:10.3f} ms"
+            f"   {result['items_per_sec']:14,.0f} items/s"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Project Cipher benchmarks")
+    parser.add_argument("--filter", default="*", help="Glob pattern of benchmark names")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--quick", action="store_true", help="Use tiny input sizes")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", help="Input sizes, e.g. --sizes 1000000"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run benchmarks")
+    run_parser.add_argument("--output", help="Save results to a JSON file")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare with a baseline")
+    compare_parser.add_argument("baseline", help="Baseline JSON file")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=10.0, help="Allowed slowdown in percent"
+    )
+    compare_parser.add_argument("--output", help="Save current results to a JSON file")
+
+    args = parser.parse_args(argv)
+
+    benchmarks = build_suite(QUICK_SIZES if args.quick else args.sizes)
+    results = run_benchmarks(benchmarks, pattern=args.filter, repeat=args.repeat)
+    print_results(results)
+
+    if args.output:
+        save_results(results, args.output)
+
+    if args.command == "compare":
+        regressions = compare_results(
+            results, load_results(args.baseline), args.threshold
+        )
+        for name, slowdown in regressions:
+            print(f"REGRESSION {name}: {slowdown:.1f}% slower than baseline")
+        if regressions:
+            return 1
+        print(f"No regressions above {args.threshold}%.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
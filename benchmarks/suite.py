@@ -0,0 +1,391 @@
+import contextlib
+import io
+import os
+import random
+import shutil
+import tempfile
+from dataclasses import dataclass
+from typing import Callable
+
+from buffer.buffer import Buffer
+from buffer.search_index import SearchIndex
+from cipher import numpy_backend
+from cipher.cipher import CipherFacade, CipherROT13, ascii_table
+from files_service.buffer_log import BufferLog
+from files_service.file_handler import FileHandler
+from files_service.lazy_buffer import LazyBuffer
+from files_service.serializers import SERIALIZERS, export
+
+DEFAULT_SIZES = [1_000, 100_000]
+QUICK_SIZES = [100]
+
+
+@dataclass
+class Benchmark:
+    """Single benchmark case.
+
+    `setup` prepares the input data and returns the callable that is timed,
+    so the preparation cost never ends up in the measurement. `teardown`
+    removes what the setup left behind, such as temporary files."""
+
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    size: int
+    teardown: Callable[[], None] | None = None
+
+
+class BenchDirectory:
+    """Temporary directories created by a benchmark setup.
+
+    `remove` is the teardown of the benchmark and deletes every directory
+    created since the last teardown."""
+
+    def __init__(self) -> None:
+        self.paths: list[str] = []
+
+    def create(self) -> str:
+        path = tempfile.mkdtemp(prefix="cipher-bench-")
+        self.paths.append(path)
+        return path
+
+    def remove(self) -> None:
+        while self.paths:
+            shutil.rmtree(self.paths.pop(), ignore_errors=True)
+
+
+def sample_text(charset: str, size: int, seed: int = 0) -> str:
+    """Generate reproducible text of the given size for the charset."""
+
+    rng = random.Random(seed)
+
+    if charset == "ascii":
+        alphabet = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 .,!?"
+    elif charset == "unicode":
+        alphabet = "abcdefXYZ éßżółćΩπжЖ中文 😀,."
+    elif charset == "binary":
+        alphabet = "".join(chr(i) for i in range(256))
+    else:
+        raise ValueError(f"Unknown charset: {charset}")
+
+    return "".join(rng.choice(alphabet) for _ in range(size))
+
+
+def filled_buffer(size: int) -> Buffer:
+    """Create a buffer holding `size` short entries."""
+
+    buffer = Buffer()
+    for i in range(size):
+        buffer.add(f"text {i}", "rot13", "encrypted")
+    return buffer
+
+
+def searchable_buffer(size: int, facade: CipherFacade) -> Buffer:
+    """Create a buffer of short sentences, plaintext and ROT encrypted."""
+
+    rng = random.Random(0)
+    words = [f"word{i}" for i in range(1000)]
+    buffer = Buffer()
+    for i in range(size):
+        sentence = " ".join(rng.choices(words, k=5))
+        cipher_type = ["rot13", "rot47", None][i % 3]
+        if cipher_type:
+            buffer.add(facade.encrypt(sentence, cipher_type), cipher_type, "encrypted")
+        else:
+            buffer.add(sentence, "rot13", "decrypted")
+    return buffer
+
+
+def cipher_benchmark(cipher_type: str, charset: str, size: int) -> Benchmark:
+    def setup():
+        facade = CipherFacade()
+        text = sample_text(charset, size)
+        return lambda: facade.encrypt(text, cipher_type)
+
+    return Benchmark(f"cipher.{cipher_type}.{charset}[{size}]", setup, size)
+
+
+def cipher_backend_benchmark(backend: str, cipher_type: str, size: int) -> Benchmark:
+    """Compare the ways of translating large ASCII input."""
+
+    def setup():
+        cipher = CipherFacade().check_cipher_type(cipher_type)
+        shift = 13 if cipher_type == "rot13" else 47
+        table = ascii_table(type(cipher), shift)
+        text = sample_text("ascii", size)
+
+        if backend == "python":
+            return lambda: cipher.python_shift(text, shift)
+        if backend == "numpy":
+            return lambda: numpy_backend.translate(text, table)
+        return lambda: text.encode("ascii").translate(table).decode("ascii")
+
+    return Benchmark(f"backend.{backend}.{cipher_type}[{size}]", setup, size)
+
+
+def unicode_backend_benchmark(backend: str, size: int) -> Benchmark:
+    """Compare the ways of applying ROT13 to mixed-script text."""
+
+    def setup():
+        cipher = CipherROT13()
+        text = sample_text("unicode", size)
+
+        if backend == "python":
+            return lambda: cipher.python_shift(text, 13)
+        if backend == "str_translate":
+            table = cipher.table(13)
+            return lambda: text.translate(table)
+        return lambda: cipher.perform_shift(text, 13)
+
+    return Benchmark(f"unicode.{backend}.rot13[{size}]", setup, size)
+
+
+def pipeline_benchmark(size: int, fused: bool) -> Benchmark:
+    """Run the rot47 -> rot13 -> rot47 chain as a pipeline or step by step."""
+
+    cipher_types = ["rot47", "rot13", "rot47"]
+
+    def setup():
+        facade = CipherFacade()
+        pipeline = facade.pipeline(*cipher_types)
+        text = sample_text("ascii", size)
+
+        def chained():
+            result = text
+            for cipher_type in cipher_types:
+                result = facade.encrypt(result, cipher_type)
+            return result
+
+        return (lambda: pipeline.encrypt(text)) if fused else chained
+
+    kind = "fused" if fused else "chained"
+    return Benchmark(f"pipeline.{kind}[{size}]", setup, size)
+
+
+def buffer_add_benchmark(size: int) -> Benchmark:
+    def setup():
+        return lambda: filled_buffer(size)
+
+    return Benchmark(f"buffer.add[{size}]", setup, size)
+
+
+def buffer_iterate_benchmark(size: int) -> Benchmark:
+    def setup():
+        buffer = filled_buffer(size)
+        return lambda: sum(len(text.content) for text in buffer.storage)
+
+    return Benchmark(f"buffer.iterate[{size}]", setup, size)
+
+
+def json_round_trip_benchmark(size: int) -> Benchmark:
+    bench_directory = BenchDirectory()
+
+    def setup():
+        buffer = filled_buffer(size)
+        directory = bench_directory.create()
+        filename = os.path.join(directory, "round_trip.json")
+
+        def round_trip():
+            loaded = Buffer()
+            with contextlib.redirect_stdout(io.StringIO()):
+                FileHandler.save_to_file(buffer, filename, "w")
+                FileHandler.load_from_file(loaded, filename)
+            return loaded
+
+        return round_trip
+
+    return Benchmark(
+        f"file.json_round_trip[{size}]", setup, size, bench_directory.remove
+    )
+
+
+def save_benchmark(size: int, incremental: bool) -> Benchmark:
+    """Save a buffer of `size` entries after adding one more entry.
+
+    The incremental case writes only the new entry, the full case forgets
+    the save mark first so the whole buffer is serialized again."""
+
+    bench_directory = BenchDirectory()
+
+    def setup():
+        buffer = filled_buffer(size)
+        directory = bench_directory.create()
+        filename = os.path.join(directory, "save.json")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            FileHandler.save_to_file(buffer, filename, "w")
+
+        def save():
+            buffer.add("new text", "rot13", "encrypted")
+            if not incremental:
+                buffer.set_save_mark(filename, None)
+            with contextlib.redirect_stdout(io.StringIO()):
+                FileHandler.save_to_file(buffer, filename, "w")
+
+        return save
+
+    kind = "incremental_save" if incremental else "full_save"
+    return Benchmark(f"file.{kind}[{size}]", setup, size, bench_directory.remove)
+
+
+def load_benchmark(size: int, lazy: bool) -> Benchmark:
+    """Open a saved buffer of `size` entries and read its last 10 entries."""
+
+    bench_directory = BenchDirectory()
+
+    def setup():
+        directory = bench_directory.create()
+        filename = os.path.join(directory, "load.json")
+        with contextlib.redirect_stdout(io.StringIO()):
+            FileHandler.save_to_file(filled_buffer(size), filename, "w")
+
+        def lazy_load():
+            with LazyBuffer(filename) as lazy_buffer:
+                return lazy_buffer.tail(10)
+
+        def full_load():
+            buffer = Buffer()
+            FileHandler.load_from_file(buffer, filename)
+            return buffer.storage[-10:]
+
+        return lazy_load if lazy else full_load
+
+    kind = "lazy_load" if lazy else "full_load"
+    return Benchmark(f"file.{kind}[{size}]", setup, size, bench_directory.remove)
+
+
+def search_benchmark(size: int, mode: str) -> Benchmark:
+    """Find entries containing a plaintext word by `mode`.
+
+    "build" indexes the buffer, "index" searches the index and "scan"
+    decrypts and checks every entry."""
+
+    def setup():
+        facade = CipherFacade()
+        buffer = searchable_buffer(size, facade)
+
+        if mode == "build":
+            # Index the entries without attaching, so repeated runs do not
+            # pile up listeners on the buffer.
+            return lambda: SearchIndex(facade).texts_added(buffer.storage)
+
+        if mode == "index":
+            index = SearchIndex(facade)
+            index.attach(buffer)
+            return lambda: index.search("word42")
+
+        def scan():
+            return [
+                i
+                for i, text in enumerate(buffer.storage)
+                if "word42"
+                in (
+                    facade.decrypt(text.content, text.rot_type)
+                    if text.status == "encrypted"
+                    else text.content
+                ).split()
+            ]
+
+        return scan
+
+    return Benchmark(f"search.{mode}[{size}]", setup, size)
+
+
+def export_benchmark(size: int, format: str) -> Benchmark:
+    """Stream a buffer of `size` entries in the format to /dev/null."""
+
+    def setup():
+        buffer = filled_buffer(size)
+
+        def run():
+            with open(os.devnull, "wb") as outfile:
+                export(buffer.storage, outfile, format)
+
+        return run
+
+    return Benchmark(f"export.{format}[{size}]", setup, size)
+
+
+def log_append_benchmark(size: int) -> Benchmark:
+    """Add `size` entries to a buffer that is logged to a write-ahead log."""
+
+    bench_directory = BenchDirectory()
+
+    def setup():
+        directory = os.path.join(bench_directory.create(), "log")
+
+        def append():
+            # Start every run from an empty log, as a fresh session would.
+            shutil.rmtree(directory, ignore_errors=True)
+            buffer = Buffer()
+            log = BufferLog(directory)
+            log.attach(buffer)
+            for i in range(size):
+                buffer.add(f"text {i}", "rot13", "encrypted")
+            log.close()
+
+        return append
+
+    return Benchmark(f"log.append[{size}]", setup, size, bench_directory.remove)
+
+
+def log_recover_benchmark(size: int) -> Benchmark:
+    """Recover 10 live entries logged after `size` cleared entries."""
+
+    bench_directory = BenchDirectory()
+
+    def setup():
+        directory = bench_directory.create()
+        buffer = Buffer()
+        log = BufferLog(directory, segment_size=64 * 1024)
+        log.attach(buffer)
+        for i in range(size):
+            buffer.add(f"text {i}", "rot13", "encrypted")
+        buffer.clear_all()
+        for i in range(10):
+            buffer.add(f"live {i}", "rot13", "encrypted")
+        log.close()
+
+        return lambda: BufferLog(directory).recover()
+
+    return Benchmark(f"log.recover[{size}]", setup, size, bench_directory.remove)
+
+
+def build_suite(sizes: list[int] | None = None) -> dict[str, Benchmark]:
+    """Build all benchmark cases for the given input sizes."""
+
+    sizes = sizes or DEFAULT_SIZES
+    benchmarks: list[Benchmark] = []
+
+    for size in sizes:
+        for cipher_type in ["rot13", "rot47", "vigenere:lemon", "xor:secret"]:
+            for charset in ["ascii", "unicode", "binary"]:
+                benchmarks.append(cipher_benchmark(cipher_type, charset, size))
+
+        for cipher_type in ["rot13", "rot47"]:
+            backends = ["python", "bytes_translate"]
+            if numpy_backend.is_available():
+                backends.append("numpy")
+            for backend in backends:
+                benchmarks.append(cipher_backend_benchmark(backend, cipher_type, size))
+
+        for backend in ["python", "str_translate", "utf8_translate"]:
+            benchmarks.append(unicode_backend_benchmark(backend, size))
+
+        benchmarks.append(pipeline_benchmark(size, fused=False))
+        benchmarks.append(pipeline_benchmark(size, fused=True))
+        benchmarks.append(buffer_add_benchmark(size))
+        benchmarks.append(buffer_iterate_benchmark(size))
+        benchmarks.append(json_round_trip_benchmark(size))
+        benchmarks.append(save_benchmark(size, incremental=False))
+        benchmarks.append(save_benchmark(size, incremental=True))
+        benchmarks.append(load_benchmark(size, lazy=False))
+        benchmarks.append(load_benchmark(size, lazy=True))
+        benchmarks.append(search_benchmark(size, "build"))
+        benchmarks.append(search_benchmark(size, "index"))
+        benchmarks.append(search_benchmark(size, "scan"))
+        for format in SERIALIZERS:
+            benchmarks.append(export_benchmark(size, format))
+        benchmarks.append(log_append_benchmark(size))
+        benchmarks.append(log_recover_benchmark(size))
+
+    return {benchmark.name: benchmark for benchmark in benchmarks}
@@ -1,12 +1,50 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import List
 from .text import Text
 
 
+@dataclass
+class SaveMark:
+    """Watermark of the last successful save of the buffer to a file.
+
+    `count` entries of buffer `generation` are in the file, which then had
+    `size` bytes, `mtime_ns` modification time and `records` records."""
+
+    generation: int
+    count: int
+    size: int
+    mtime_ns: int
+    records: int
+
+
+class BufferListener(ABC):
+    """Abstract base class for objects following changes of a Buffer."""
+
+    @abstractmethod
+    def texts_added(self, texts: List[Text]) -> None:
+        """Called after texts were added to the buffer."""
+        pass
+
+    @abstractmethod
+    def buffer_cleared(self) -> None:
+        """Called after the buffer was cleared."""
+        pass
+
+
 class Buffer:
     """Buffer holding a list of Text objects."""
 
     def __init__(self):
         self.storage: List[Text] = []
+        self.generation: int = 0
+        self.save_marks: dict[str, SaveMark] = {}
+        self.listeners: List[BufferListener] = []
+
+    def add_listener(self, listener: BufferListener) -> None:
+        """Notify the listener about every following change of the buffer."""
+
+        self.listeners.append(listener)
 
     def __str__(self):
         if not self.storage:
@@ -15,23 +53,54 @@ class Buffer:
         buffer_content = "\n".join(str(text) for text in self.storage)
         return f"Buffer content:\n{buffer_content}"
 
-    def add(self, content: str, rot_type: str, status: str) -> None:
-        """Add the text to the buffer with specified status."""
+    def add(
+        self,
+        content: str,
+        rot_type: str,
+        status: str,
+        steps: list[str] | None = None,
+    ) -> None:
+        """Add the text to the buffer with specified status.
+        `steps` lists the ciphers applied by a cipher pipeline."""
 
-        text = Text(content=content, rot_type=rot_type, status=status)
+        text = Text(
+            content=content, rot_type=rot_type, status=status, steps=steps or []
+        )
         self.storage.append(text)
 
+        for listener in self.listeners:
+            listener.texts_added([text])
+
     def add_bulk(self, data: list[dict[str, str]]) -> None:
         """Add multiple texts to the buffer from a list of dictionaries."""
 
-        for item in data:
-            data = Text(**item)
-            self.storage.append(data)
+        texts = [Text(**item) for item in data]
+        self.storage.extend(texts)
+
+        for listener in self.listeners:
+            listener.texts_added(texts)
 
     def clear_all(self):
-        """Clear the buffer."""
+        """Clear the buffer and start a new generation of entries."""
 
         self.storage.clear()
+        self.generation += 1
+
+        for listener in self.listeners:
+            listener.buffer_cleared()
+
+    def get_save_mark(self, filename: str) -> SaveMark | None:
+        """Return the watermark of the last save to the file."""
+
+        return self.save_marks.get(filename)
+
+    def set_save_mark(self, filename: str, mark: SaveMark | None) -> None:
+        """Store the watermark of a save, None forgets the file."""
+
+        if mark is None:
+            self.save_marks.pop(filename, None)
+        else:
+            self.save_marks[filename] = mark
 
     def display(self):
         """Display the content of the buffer."""
@@ -0,0 +1,154 @@
+from collections import defaultdict
+from typing import List
+
+from cipher.cipher import CipherFacade, CipherNotFoundError
+from .buffer import Buffer, BufferListener
+from .text import Text
+
+# Encrypt and decrypt str.translate tables of a cipher.
+Tables = tuple[dict[int, int], dict[int, int]]
+
+
+class TokenTable(dict):
+    """str.translate table splitting text into lowercase tokens.
+
+    Alphanumeric characters are lowercased and every other character turns
+    into a space, so the translated text only needs a split. For ciphertext
+    of a translation-table cipher characters are classified and lowercased
+    by their decryption, so tokens of the ciphertext are the encrypted
+    tokens of the plaintext."""
+
+    def __init__(
+        self,
+        encrypt_table: dict[int, int] | None = None,
+        decrypt_table: dict[int, int] | None = None,
+    ) -> None:
+
+        super().__init__()
+        self.encrypt_table = encrypt_table or {}
+        self.decrypt_table = decrypt_table or {}
+
+        for code in set(range(128)) | self.decrypt_table.keys():
+            plain = chr(self.decrypt_table.get(code, code))
+            if plain.isalnum():
+                self[code] = plain.lower().translate(self.encrypt_table)
+            else:
+                self[code] = " "
+
+    def __missing__(self, code: int) -> str:
+        char = chr(code)
+        self[code] = char.lower() if char.isalnum() else " "
+        return self[code]
+
+    def tokens(self, text: str) -> List[str]:
+        return text.translate(self).split()
+
+
+class SearchIndex(BufferListener):
+    """Inverted index from tokens to the positions of Buffer entries.
+
+    Entries are indexed as stored, grouped by cipher type and status.
+    Encrypted entries of ROT ciphers (and their pipelines) can still be
+    searched for a plaintext word: the query is encrypted with the cipher's
+    translation table instead of decrypting every entry. Entries of keyed
+    ciphers are only searchable by their ciphertext."""
+
+    def __init__(self, cipher_facade: CipherFacade | None = None) -> None:
+        self.cipher_facade = cipher_facade or CipherFacade()
+        self.plain_tokens = TokenTable()
+        self.cipher_tables: dict[str, Tables | None] = {}
+        self.token_tables: dict[str, TokenTable] = {}
+        self.postings: dict[tuple[str, str], dict[str, List[int]]] = {}
+        self.size = 0
+
+    def attach(self, buffer: Buffer) -> None:
+        """Index the entries of the buffer and follow its changes."""
+
+        self.texts_added(buffer.storage)
+        buffer.add_listener(self)
+
+    def tables(self, rot_type: str) -> Tables | None:
+        """Encrypt and decrypt tables of the cipher type, None for keyed ciphers."""
+
+        if rot_type not in self.cipher_tables:
+            try:
+                cipher = self.cipher_facade.check_cipher_type(rot_type)
+            except CipherNotFoundError:
+                cipher = None
+
+            if cipher is None or cipher.translation_table() is None:
+                self.cipher_tables[rot_type] = None
+            else:
+                self.cipher_tables[rot_type] = (
+                    cipher.translation_table(),
+                    cipher.translation_table(decrypt=True),
+                )
+        return self.cipher_tables[rot_type]
+
+    def token_table(self, rot_type: str, status: str) -> TokenTable:
+        """Token table for the stored content of entries of the group."""
+
+        if status != "encrypted":
+            return self.plain_tokens
+
+        if rot_type not in self.token_tables:
+            tables = self.tables(rot_type)
+            self.token_tables[rot_type] = (
+                TokenTable(*tables) if tables else self.plain_tokens
+            )
+        return self.token_tables[rot_type]
+
+    def texts_added(self, texts: List[Text]) -> None:
+        for text in texts:
+            group = (text.rot_type, text.status)
+            if group not in self.postings:
+                self.postings[group] = defaultdict(list)
+            postings = self.postings[group]
+
+            token_table = self.token_table(text.rot_type, text.status)
+            for token in set(token_table.tokens(text.content)):
+                postings[token].append(self.size)
+            self.size += 1
+
+    def buffer_cleared(self) -> None:
+        self.postings.clear()
+        self.size = 0
+
+    def query_text(self, query: str, rot_type: str, status: str, ciphertext: bool):
+        """Bring the query to the side of the stored entries of the group.
+
+        Returns None when the group can not be searched for the query."""
+
+        if ciphertext == (status == "encrypted"):
+            return query
+
+        tables = self.tables(rot_type)
+        if tables is None:
+            return None
+
+        encrypt_table, decrypt_table = tables
+        return query.translate(decrypt_table if ciphertext else encrypt_table)
+
+    def search(self, query: str, ciphertext: bool = False) -> List[int]:
+        """Return positions of entries containing all words of the query.
+
+        Words are matched case-insensitively in the plaintext of the entries,
+        or in their ciphertext when `ciphertext` is set."""
+
+        positions = []
+
+        for (rot_type, status), postings in self.postings.items():
+            text = self.query_text(query, rot_type, status, ciphertext)
+            if text is None:
+                continue
+
+            tokens = self.token_table(rot_type, status).tokens(text)
+            if not tokens:
+                continue
+
+            matches = set(postings.get(tokens[0], ()))
+            for token in tokens[1:]:
+                matches.intersection_update(postings.get(token, ()))
+            positions.extend(matches)
+
+        return sorted(positions)
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -8,3 +8,4 @@ class Text:
     content: str
     rot_type: str
     status: str
+    steps: list[str] = field(default_factory=list)
@@ -1,4 +1,8 @@
+import re
 from abc import ABC, abstractmethod
+from functools import cache
+from string import ascii_letters, ascii_lowercase, ascii_uppercase
+from typing import Sequence
 
 
 class CipherNotFoundError(Exception):
@@ -10,6 +14,8 @@ class CipherNotFoundError(Exception):
 class Cipher(ABC):
     """Abstract base class for ciphers."""
 
+    supports_bytes: bool = False
+
     @abstractmethod
     def encrypt(self, text: str) -> str:
         """Encrypts the provided text."""
@@ -25,24 +31,114 @@ class Cipher(ABC):
         """Calculating the shift to encrypt and decrypt the text."""
         pass
 
+    def stream(self, decrypt: bool = False) -> "CipherStream":
+        """Return a stream that encrypts or decrypts consecutive chunks."""
+
+        return CipherStream(self, decrypt)
+
+    def translation_table(self, decrypt: bool = False) -> dict[int, int] | None:
+        """Position-independent str.translate table of the cipher.
+
+        None for ciphers that can not be expressed as a single table."""
+
+        return None
+
+
+class CipherStream:
+    """Applies a cipher to consecutive chunks of a larger text."""
+
+    def __init__(self, cipher: Cipher, decrypt: bool = False) -> None:
+        self.cipher = cipher
+        self.decrypt = decrypt
+
+    def update(self, chunk):
+        """Encrypt or decrypt the next chunk."""
+
+        if self.decrypt:
+            return self.cipher.decrypt(chunk)
+        return self.cipher.encrypt(chunk)
+
+
+def table_from_ascii(table: bytes) -> dict[int, int]:
+    """Turn a 256-byte table into a str.translate table of changed characters."""
+
+    return {code: mapped for code, mapped in enumerate(table) if code != mapped}
+
+
+@cache
+def ascii_table(cipher_class: type, shift: int) -> bytes:
+    """Build a 256-byte translation table of the cipher shift for ASCII text."""
+
+    ascii_chars = "".join(chr(code) for code in range(128))
+    shifted = cipher_class().python_shift(ascii_chars, shift)
+    return shifted.encode("ascii") + bytes(range(128, 256))
+
+
+def translate_utf8(text: str, table: bytes) -> str:
+    """Translate text with a 256-byte table of ASCII characters.
+
+    The text is translated as UTF-8 bytes: ASCII bytes never occur inside
+    multi-byte characters, so all other characters are copied unchanged
+    in bulk."""
+
+    data = text.encode("utf-8", "surrogatepass")
+    return data.translate(table).decode("utf-8", "surrogatepass")
+
 
 class CipherROT13(Cipher):
-    """ROT13 cipher implementation."""
+    """ROT13 cipher implementation.
+
+    Rotates ASCII letters and optionally the letters of extra non-ASCII
+    alphabets, e.g. "абвгдежзийклмнопрстуфхцчшщъыьэюя". Every alphabet is
+    rotated within its own length, so decryption shifts back by 13."""
+
+    def __init__(self, alphabets: Sequence[str] = ()) -> None:
+        letters = "".join(alphabets)
+        if any(char.isascii() for char in letters):
+            raise ValueError("Extra alphabets must not contain ASCII characters.")
+        if len(set(letters)) != len(letters):
+            raise ValueError("Extra alphabets must not repeat characters.")
+
+        self.alphabets = tuple(alphabet for alphabet in alphabets if alphabet)
+        self.tables: dict[int, dict[int, int]] = {}
 
     def encrypt(self, text: str) -> str:
         return self.perform_shift(text, shift=13)
 
     def decrypt(self, text: str) -> str:
-        return self.perform_shift(text, shift=13)
+        return self.perform_shift(text, shift=-13)
+
+    def translation_table(self, decrypt: bool = False) -> dict[int, int]:
+        return self.table(-13 if decrypt else 13)
+
+    def table(self, shift: int) -> dict[int, int]:
+        """str.translate table rotating every alphabet by the shift."""
+
+        if shift not in self.tables:
+            table = table_from_ascii(ascii_table(type(self), shift))
+            for alphabet in self.alphabets:
+                offset = shift % len(alphabet)
+                rotated = alphabet[offset:] + alphabet[:offset]
+                table.update(str.maketrans(alphabet, rotated))
+            self.tables[shift] = table
+        return self.tables[shift]
 
     def perform_shift(self, text: str, shift: int) -> str:
         """Calculate shift for text according to ROT13 cipher.
-        Works on only alphabetic characters."""
+        Without extra alphabets other text is translated as UTF-8 bytes."""
+
+        if self.alphabets or text.isascii():
+            return text.translate(self.table(shift))
+        return translate_utf8(text, ascii_table(type(self), shift))
+
+    def python_shift(self, text: str, shift: int) -> str:
+        """Calculate shift for text according to ROT13 cipher.
+        Works on only ASCII letters."""
 
         rot13_txt = ""
 
         for char in text:
-            if char.isalpha():
+            if char in ascii_letters:
                 ascii_offset = ord("a") if char.islower() else ord("A")
                 alphabet_position = (ord(char) - ascii_offset + shift) % 26
                 shifted_char = chr(alphabet_position + ascii_offset)
@@ -61,7 +157,16 @@ class CipherROT47(Cipher):
     def decrypt(self, text: str) -> str:
         return self.perform_shift(text, shift=47)
 
+    def translation_table(self, decrypt: bool = False) -> dict[int, int]:
+        return table_from_ascii(ascii_table(type(self), 47))
+
     def perform_shift(self, text: str, shift: int) -> str:
+        """Calculate shift for text according to ROT47 cipher.
+        Text is translated in bulk with the table of the shift."""
+
+        return translate_utf8(text, ascii_table(type(self), shift))
+
+    def python_shift(self, text: str, shift: int) -> str:
         """Calculate shift for text according to ROT47 cipher.
         Works on ASCII characters from '!' (33) to '~' (126)."""
 
@@ -77,20 +182,252 @@ class CipherROT47(Cipher):
         return rot47_txt
 
 
+class KeyedCipher(Cipher):
+    """Base class for ciphers whose shift depends on the position in the text.
+
+    The key is turned into one translation table per key position once.
+    Text is then processed in bulk with one translate call per key position
+    over every key-length-th character. By default every character or byte
+    moves the key by one position. Works on both str and bytes."""
+
+    supports_bytes = True
+
+    def __init__(self, key: str) -> None:
+        if not key:
+            raise ValueError("Key must not be empty.")
+
+        self.key = key
+        shifts = self.key_shifts()
+        self.key_length = len(shifts)
+
+        self.encrypt_tables = [self.text_table(shift, False) for shift in shifts]
+        self.decrypt_tables = [self.text_table(shift, True) for shift in shifts]
+        self.encrypt_byte_tables = [self.bytes_table(shift, False) for shift in shifts]
+        self.decrypt_byte_tables = [self.bytes_table(shift, True) for shift in shifts]
+
+    @abstractmethod
+    def key_shifts(self) -> list[int]:
+        """Shift of every key position."""
+        pass
+
+    @abstractmethod
+    def text_table(self, shift: int, decrypt: bool) -> dict[int, int]:
+        """Translation table for str.translate of a single key position."""
+        pass
+
+    @abstractmethod
+    def bytes_table(self, shift: int, decrypt: bool) -> bytes:
+        """256-byte translation table of a single key position."""
+        pass
+
+    def encrypt(self, text: str | bytes) -> str | bytes:
+        return self.apply(text, decrypt=False)
+
+    def decrypt(self, text: str | bytes) -> str | bytes:
+        return self.apply(text, decrypt=True)
+
+    def perform_shift(self, text: str | bytes, shift: int) -> str | bytes:
+        """Encrypt the text starting at key position `shift`."""
+
+        return self.apply(text, decrypt=False, phase=shift)
+
+    def apply(self, data: str | bytes, decrypt: bool, phase: int = 0) -> str | bytes:
+        """Encrypt or decrypt the data starting at the key position `phase`."""
+
+        if isinstance(data, str):
+            tables = self.decrypt_tables if decrypt else self.encrypt_tables
+            result = list(data)
+        else:
+            tables = self.decrypt_byte_tables if decrypt else self.encrypt_byte_tables
+            result = bytearray(data)
+
+        for position in range(min(self.key_length, len(data))):
+            table = tables[(phase + position) % self.key_length]
+            result[position :: self.key_length] = data[
+                position :: self.key_length
+            ].translate(table)
+
+        if isinstance(data, str):
+            return "".join(result)
+        return bytes(result)
+
+    def key_positions(self, data: str | bytes) -> int:
+        """Number of key positions the data moves the key by."""
+
+        return len(data)
+
+    def stream(self, decrypt: bool = False) -> "KeyStream":
+        return KeyStream(self, decrypt)
+
+
+class KeyStream(CipherStream):
+    """Stream of a keyed cipher that carries the key position across chunks."""
+
+    def __init__(self, cipher: KeyedCipher, decrypt: bool = False) -> None:
+        super().__init__(cipher, decrypt)
+        self.phase = 0
+
+    def update(self, chunk: str | bytes) -> str | bytes:
+        result = self.cipher.apply(chunk, self.decrypt, self.phase)
+        self.phase = (
+            self.phase + self.cipher.key_positions(chunk)
+        ) % self.cipher.key_length
+        return result
+
+
+LETTER_RUNS = re.compile("([A-Za-z]+)")
+LETTER_RUNS_BYTES = re.compile(b"([A-Za-z]+)")
+
+
+class CipherVigenere(KeyedCipher):
+    """Vigenère cipher implementation.
+
+    Key letters shift ASCII letters by their alphabet position (A=0, B=1...).
+    Only ASCII letters move the key, other characters are not changed, so
+    "attack at dawn" with the key "lemon" gives "lxfopv ef rnhr". Non-ASCII
+    characters never contain ASCII bytes in UTF-8, so encrypted bytes match
+    the encrypted str."""
+
+    def key_shifts(self) -> list[int]:
+        if not (self.key.isascii() and self.key.isalpha()):
+            raise ValueError("Vigenère key must contain only ASCII letters.")
+        return [ord(char) - ord("a") for char in self.key.lower()]
+
+    @staticmethod
+    def shifted_alphabets(shift: int, decrypt: bool) -> tuple[str, str]:
+        shift = (-shift if decrypt else shift) % 26
+        letters = ascii_lowercase + ascii_uppercase
+        shifted = (
+            ascii_lowercase[shift:]
+            + ascii_lowercase[:shift]
+            + ascii_uppercase[shift:]
+            + ascii_uppercase[:shift]
+        )
+        return letters, shifted
+
+    def text_table(self, shift: int, decrypt: bool) -> dict[int, int]:
+        return str.maketrans(*self.shifted_alphabets(shift, decrypt))
+
+    @staticmethod
+    def letter_runs(data: str | bytes) -> list:
+        """Split the data into alternating runs of non-letters and letters."""
+
+        pattern = LETTER_RUNS if isinstance(data, str) else LETTER_RUNS_BYTES
+        return pattern.split(data)
+
+    def key_positions(self, data: str | bytes) -> int:
+        return sum(map(len, self.letter_runs(data)[1::2]))
+
+    def apply(self, data: str | bytes, decrypt: bool, phase: int = 0) -> str | bytes:
+        """Shift only the letters, joined together so the bulk translate
+        of KeyedCipher still applies, and put them back between the rest."""
+
+        parts = self.letter_runs(data)
+        letters = super().apply(data[:0].join(parts[1::2]), decrypt, phase)
+
+        start = 0
+        for index in range(1, len(parts), 2):
+            end = start + len(parts[index])
+            parts[index] = letters[start:end]
+            start = end
+
+        return data[:0].join(parts)
+
+    def bytes_table(self, shift: int, decrypt: bool) -> bytes:
+        letters, shifted = self.shifted_alphabets(shift, decrypt)
+        return bytes.maketrans(letters.encode("ascii"), shifted.encode("ascii"))
+
+
+class XorTable(dict):
+    """str.translate table XOR-ing every code point with the key byte."""
+
+    def __init__(self, key_byte: int) -> None:
+        super().__init__((code, code ^ key_byte) for code in range(256))
+        self.key_byte = key_byte
+
+    def __missing__(self, code: int) -> int:
+        return code ^ self.key_byte
+
+
+class CipherXOR(KeyedCipher):
+    """Repeating-key XOR cipher implementation.
+
+    Bytes are XOR-ed with the UTF-8 encoded key, str code points are XOR-ed
+    with the same key bytes. Encryption and decryption are the same."""
+
+    def key_shifts(self) -> list[int]:
+        return list(self.key.encode("utf-8"))
+
+    def text_table(self, shift: int, decrypt: bool) -> dict[int, int]:
+        return XorTable(shift)
+
+    def bytes_table(self, shift: int, decrypt: bool) -> bytes:
+        return bytes(code ^ shift for code in range(256))
+
+
+CIPHER_NAMES = ["rot13", "rot47", "vigenere", "xor"]
+
+
+def split_cipher_type(cipher_type: str, cipher_names=CIPHER_NAMES) -> list[str]:
+    """Split a pipeline like 'rot47+xor:a+b' into its cipher types.
+
+    A '+' starts the next cipher only when a known cipher name follows
+    it, otherwise it is part of the key of the keyed cipher before it."""
+
+    cipher_types: list[str] = []
+    for part in cipher_type.split("+"):
+        known = part.partition(":")[0].lower() in cipher_names
+        if cipher_types and not known and ":" in cipher_types[-1]:
+            cipher_types[-1] += "+" + part
+        else:
+            cipher_types.append(part)
+    return cipher_types
+
+
+def redact_cipher_type(cipher_type: str) -> str:
+    """Cipher type without keys, safe to store next to the ciphertext.
+
+    'rot47+vigenere:lemon' becomes 'rot47+vigenere'."""
+
+    return "+".join(part.partition(":")[0] for part in split_cipher_type(cipher_type))
+
+
 class CipherFacade:
-    """Facade for encryption operations."""
+    """Facade for encryption operations.
+
+    `rot13_alphabets` are the extra alphabets of ROT13; the application
+    passes them from the settings, so the facade never reads them itself."""
 
-    def __init__(self):
+    def __init__(self, rot13_alphabets: Sequence[str] = ()):
         self.ciphers: dict[str, Cipher] = {
-            "rot13": CipherROT13(),
+            "rot13": CipherROT13(rot13_alphabets),
             "rot47": CipherROT47(),
         }
+        self.keyed_ciphers: dict[str, type[KeyedCipher]] = {
+            "vigenere": CipherVigenere,
+            "xor": CipherXOR,
+        }
+        self.keyed_instances: dict[tuple[str, str], KeyedCipher] = {}
 
     def check_cipher_type(self, cipher_type: str) -> Cipher:
-        """Validates the cipher type and returns the corresponding cipher."""
+        """Validates the cipher type and returns the corresponding cipher.
+
+        Keyed ciphers are given with their key, e.g. 'vigenere:lemon'."""
+
+        cipher_types = self.split_cipher_type(cipher_type)
+        if len(cipher_types) > 1:
+            return self.pipeline(*cipher_types)
+
+        name, separator, key = cipher_type.partition(":")
+        name = name.lower()
+
+        if name in self.keyed_ciphers:
+            return self.keyed_cipher(name, key, separator)
 
         cipher_type = cipher_type.lower()
-        available_ciphers = ", ".join(self.ciphers.keys())
+        available_ciphers = ", ".join(
+            [*self.ciphers.keys(), *(f"{name}:KEY" for name in self.keyed_ciphers)]
+        )
 
         try:
             return self.ciphers[cipher_type]
@@ -99,6 +436,27 @@ class CipherFacade:
                 f"Cipher type {cipher_type} not found. Available ciphers: {available_ciphers}."
             )
 
+    def split_cipher_type(self, cipher_type: str) -> list[str]:
+        """Split a pipeline into its cipher types, see split_cipher_type."""
+
+        return split_cipher_type(cipher_type, [*self.ciphers, *self.keyed_ciphers])
+
+    def keyed_cipher(self, name: str, key: str, separator: str) -> KeyedCipher:
+        """Return the keyed cipher, creating its tables only once per key."""
+
+        if not separator or not key:
+            raise CipherNotFoundError(
+                f"Cipher type {name} requires a key, e.g. {name}:KEY."
+            )
+
+        if (name, key) not in self.keyed_instances:
+            try:
+                self.keyed_instances[(name, key)] = self.keyed_ciphers[name](key)
+            except ValueError as e:
+                raise CipherNotFoundError(f"Invalid key for cipher {name}: {e}")
+
+        return self.keyed_instances[(name, key)]
+
     def encrypt(self, text: str, cipher_type: str) -> str:
         """Encrypts the text using the provided cipher type."""
 
@@ -108,3 +466,28 @@ class CipherFacade:
         """Decrypts the text using the provided cipher type."""
 
         return self.check_cipher_type(cipher_type).decrypt(text)
+
+    def pipeline(self, *cipher_types: str) -> Cipher:
+        """Chain the cipher types into a CipherPipeline, e.g. ("rot47", "rot13").
+
+        Consecutive ROT ciphers are fused into one translation table. The
+        steps of the pipeline name the ciphers without their keys."""
+
+        # Imported here because the pipeline builds on the cipher classes.
+        from .pipeline import CipherPipeline
+
+        ciphers = [
+            (redact_cipher_type(cipher_type), self.check_cipher_type(cipher_type))
+            for cipher_type in cipher_types
+        ]
+        return CipherPipeline(ciphers)
+
+    def detect(self, text: str, sample_size: int | None = None) -> list:
+        """Rank the ROT ciphers that could have produced the text.
+
+        Returns DetectionCandidate objects, the most likely first."""
+
+        # Imported here because the detector builds on the cipher classes.
+        from .detector import DEFAULT_SAMPLE_SIZE, detect
+
+        return detect(text, sample_size or DEFAULT_SAMPLE_SIZE)
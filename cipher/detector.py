@@ -0,0 +1,117 @@
+import math
+from collections import Counter
+from dataclasses import dataclass
+from functools import cache
+
+from .cipher import Cipher, CipherROT13, CipherROT47
+
+# Relative frequency of letters in English text (percent).
+ENGLISH_LETTER_FREQUENCY = {
+    "a": 8.17, "b": 1.49, "c": 2.78, "d": 4.25, "e": 12.70, "f": 2.23,
+    "g": 2.02, "h": 6.09, "i": 6.97, "j": 0.15, "k": 0.77, "l": 4.03,
+    "m": 2.41, "n": 6.75, "o": 7.51, "p": 1.93, "q": 0.10, "r": 5.99,
+    "s": 6.33, "t": 9.06, "u": 2.76, "v": 0.98, "w": 2.36, "x": 0.15,
+    "y": 1.97, "z": 0.07,
+}  # fmt: skip
+
+COMMON_PUNCTUATION = ".,'\"!?-;:()"
+
+# Scores of characters that are not letters, on the same scale as letters.
+DIGIT_FREQUENCY = 0.5
+COMMON_PUNCTUATION_FREQUENCY = 1.0
+OTHER_FREQUENCY = 0.01
+
+# Only printable ASCII characters are changed by the ROT ciphers,
+# so the histogram and score vectors cover '!' (33) to '~' (126).
+FIRST_CHAR = 33
+LAST_CHAR = 126
+
+DEFAULT_SAMPLE_SIZE = 4096
+
+
+@dataclass
+class DetectionCandidate:
+    """Possible cipher of a text with its English-likeness score.
+
+    Decrypt the text with `cipher.perform_shift(text, shift)`, where
+    `cipher` is the `cipher_type` cipher from CipherFacade."""
+
+    name: str
+    cipher_type: str
+    shift: int
+    score: float
+
+
+def char_score(char: str) -> float:
+    """Log-probability like score of a single decrypted character."""
+
+    if char.isascii() and char.isalpha():
+        frequency = ENGLISH_LETTER_FREQUENCY[char.lower()]
+    elif char.isdigit():
+        frequency = DIGIT_FREQUENCY
+    elif char in COMMON_PUNCTUATION:
+        frequency = COMMON_PUNCTUATION_FREQUENCY
+    else:
+        frequency = OTHER_FREQUENCY
+    return math.log(frequency / 100)
+
+
+def score_vector(cipher: Cipher, shift: int) -> list[float]:
+    """Score of every printable character after decrypting it with the shift."""
+
+    return [
+        char_score(cipher.perform_shift(chr(code), shift))
+        for code in range(FIRST_CHAR, LAST_CHAR + 1)
+    ]
+
+
+@cache
+def candidate_vectors() -> list[tuple[DetectionCandidate, list[float]]]:
+    """Precompute the score vector of every ROT candidate once."""
+
+    rot13 = CipherROT13()
+    rot47 = CipherROT47()
+
+    candidates = []
+    for rotation in range(1, 26):
+        # Text encrypted with ROT-N is decrypted by shifting 26 - N positions.
+        shift = 26 - rotation
+        candidate = DetectionCandidate(f"rot{rotation}", "rot13", shift, 0.0)
+        candidates.append((candidate, score_vector(rot13, shift)))
+
+    candidate = DetectionCandidate("rot47", "rot47", 47, 0.0)
+    candidates.append((candidate, score_vector(rot47, 47)))
+
+    return candidates
+
+
+def histogram(text: str) -> list[int]:
+    """Count printable ASCII characters of the text."""
+
+    counts = Counter(text)
+    return [counts.get(chr(code), 0) for code in range(FIRST_CHAR, LAST_CHAR + 1)]
+
+
+def detect(
+    text: str, sample_size: int = DEFAULT_SAMPLE_SIZE
+) -> list[DetectionCandidate]:
+    """Rank the ROT candidates for the text, the most likely first.
+
+    Only the first `sample_size` characters are scored. The text is counted
+    once and every candidate is scored as a dot product of that histogram
+    with its precomputed vector, so no candidate decryption is made."""
+
+    counts = histogram(text[:sample_size])
+    total = sum(counts)
+
+    results = []
+    for candidate, vector in candidate_vectors():
+        score = sum(c * w for c, w in zip(counts, vector)) / total if total else 0.0
+        results.append(
+            DetectionCandidate(
+                candidate.name, candidate.cipher_type, candidate.shift, score
+            )
+        )
+
+    results.sort(key=lambda result: result.score, reverse=True)
+    return results
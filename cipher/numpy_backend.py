@@ -0,0 +1,42 @@
+# Optional NumPy lookup-table backend. The ciphers never pick it on their own,
+# bytes.translate and str.translate are faster for new strings; it only pays
+# off when a caller translates its own bytearray or memoryview in place.
+
+from functools import cache
+
+
+@cache
+def get_numpy():
+    """Import NumPy on the first use, None when it is not installed.
+
+    Importing NumPy takes longer than importing the rest of the ciphers,
+    so it is only imported once the backend is used."""
+
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def is_available() -> bool:
+    """Check if NumPy is installed."""
+
+    return get_numpy() is not None
+
+
+def translate_buffer(data: bytearray | memoryview, table: bytes) -> None:
+    """Translate a writable byte buffer in place with a 256-byte table."""
+
+    numpy = get_numpy()
+    array = numpy.frombuffer(data, dtype=numpy.uint8)
+    lookup_table = numpy.frombuffer(table, dtype=numpy.uint8)
+    numpy.take(lookup_table, array, out=array)
+
+
+def translate(text: str, table: bytes) -> str:
+    """Translate ASCII text with a 256-byte table using a single gather."""
+
+    data = bytearray(text.encode("ascii"))
+    translate_buffer(data, table)
+    return data.decode("ascii")
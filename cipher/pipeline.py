@@ -0,0 +1,137 @@
+from .cipher import Cipher, CipherStream
+
+
+def compose_tables(first: dict[int, int], second: dict[int, int]) -> dict[int, int]:
+    """Translation table applying `first` and then `second`."""
+
+    table = {}
+    for code in first.keys() | second.keys():
+        mapped = first.get(code, code)
+        mapped = second.get(mapped, mapped)
+        if mapped != code:
+            table[code] = mapped
+    return table
+
+
+def bytes_table(table: dict[int, int]) -> bytes | None:
+    """256-byte table for bytes.translate, None if the table is not byte-sized."""
+
+    if any(code > 255 or mapped > 255 for code, mapped in table.items()):
+        return None
+    return bytes(table.get(code, code) for code in range(256))
+
+
+class TranslationCipher(Cipher):
+    """Cipher applying fixed translation tables, e.g. fused ROT ciphers."""
+
+    def __init__(
+        self, encrypt_table: dict[int, int], decrypt_table: dict[int, int]
+    ) -> None:
+
+        self.encrypt_table = encrypt_table
+        self.decrypt_table = decrypt_table
+        self.encrypt_bytes_table = bytes_table(encrypt_table)
+        self.decrypt_bytes_table = bytes_table(decrypt_table)
+        self.supports_bytes = self.encrypt_bytes_table is not None
+
+    def encrypt(self, text: str | bytes) -> str | bytes:
+        return self.perform_shift(text, 1)
+
+    def decrypt(self, text: str | bytes) -> str | bytes:
+        return self.perform_shift(text, -1)
+
+    def perform_shift(self, text: str | bytes, shift: int) -> str | bytes:
+        """Translate the text, a negative shift decrypts it."""
+
+        if isinstance(text, str):
+            return text.translate(
+                self.encrypt_table if shift >= 0 else self.decrypt_table
+            )
+        return text.translate(
+            self.encrypt_bytes_table if shift >= 0 else self.decrypt_bytes_table
+        )
+
+    def translation_table(self, decrypt: bool = False) -> dict[int, int]:
+        return self.decrypt_table if decrypt else self.encrypt_table
+
+
+class CipherPipeline(Cipher):
+    """Chain of ciphers applied one after another.
+
+    Consecutive ciphers with translation tables (ROT13, ROT47) are fused
+    into a single table, so the chain makes one pass over the text per
+    group of table ciphers and per keyed cipher. Decryption runs the chain
+    backwards."""
+
+    def __init__(self, ciphers: list[tuple[str, Cipher]]) -> None:
+        if not ciphers:
+            raise ValueError("Pipeline needs at least one cipher.")
+
+        self.steps = [name for name, _ in ciphers]
+        self.stages: list[Cipher] = []
+        encrypt_table: dict[int, int] | None = None
+        decrypt_table: dict[int, int] | None = None
+
+        for _, cipher in ciphers:
+            table = cipher.translation_table()
+            if table is None:
+                if encrypt_table is not None:
+                    self.stages.append(TranslationCipher(encrypt_table, decrypt_table))
+                    encrypt_table = decrypt_table = None
+                self.stages.append(cipher)
+            elif encrypt_table is None:
+                encrypt_table = table
+                decrypt_table = cipher.translation_table(decrypt=True)
+            else:
+                encrypt_table = compose_tables(encrypt_table, table)
+                decrypt_table = compose_tables(
+                    cipher.translation_table(decrypt=True), decrypt_table
+                )
+
+        if encrypt_table is not None:
+            self.stages.append(TranslationCipher(encrypt_table, decrypt_table))
+
+        self.supports_bytes = all(stage.supports_bytes for stage in self.stages)
+
+    @property
+    def name(self) -> str:
+        return "+".join(self.steps)
+
+    def encrypt(self, text: str | bytes) -> str | bytes:
+        for stage in self.stages:
+            text = stage.encrypt(text)
+        return text
+
+    def decrypt(self, text: str | bytes) -> str | bytes:
+        for stage in reversed(self.stages):
+            text = stage.decrypt(text)
+        return text
+
+    def perform_shift(self, text: str | bytes, shift: int) -> str | bytes:
+        """Run the chain, a negative shift decrypts the text."""
+
+        return self.encrypt(text) if shift >= 0 else self.decrypt(text)
+
+    def translation_table(self, decrypt: bool = False) -> dict[int, int] | None:
+        """Fused table of a pipeline made only of table ciphers."""
+
+        if len(self.stages) == 1:
+            return self.stages[0].translation_table(decrypt)
+        return None
+
+    def stream(self, decrypt: bool = False) -> "PipelineStream":
+        return PipelineStream(self, decrypt)
+
+
+class PipelineStream(CipherStream):
+    """Stream of a pipeline that keeps the state of every stage."""
+
+    def __init__(self, cipher: CipherPipeline, decrypt: bool = False) -> None:
+        super().__init__(cipher, decrypt)
+        stages = reversed(cipher.stages) if decrypt else cipher.stages
+        self.streams = [stage.stream(decrypt) for stage in stages]
+
+    def update(self, chunk: str | bytes) -> str | bytes:
+        for stream in self.streams:
+            chunk = stream.update(chunk)
+        return chunk
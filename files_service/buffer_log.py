@@ -0,0 +1,217 @@
+import json
+import os
+import struct
+import threading
+import zlib
+from dataclasses import asdict
+from typing import List
+
+from buffer.buffer import Buffer, BufferListener
+from buffer.text import Text
+from settings import get_settings
+
+# Every record is prefixed with its payload length and CRC32 checksum.
+RECORD_HEADER = struct.Struct("<II")
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".log"
+SNAPSHOT_NAME = "snapshot.json"
+COMPACT_AFTER_SEGMENTS = 4
+
+
+class BufferLog(BufferListener):
+    """Append-only write-ahead log of Buffer changes.
+
+    Every added text and every clear is appended to the active segment as
+    a length-prefixed, CRC-checked JSON record. Once a segment reaches its
+    size limit, and on every attach, a new one is started. After a few
+    closed segments a background thread folds them into a snapshot of the
+    live entries, so recovery reads the snapshot plus only the newest
+    segments."""
+
+    def __init__(
+        self,
+        directory: str,
+        segment_size: int | None = None,
+        fsync: bool | None = None,
+        compact_after: int = COMPACT_AFTER_SEGMENTS,
+    ) -> None:
+
+        settings = get_settings()
+        self.directory = directory
+        self.segment_size = segment_size or settings.log_segment_size
+        self.fsync = settings.log_fsync if fsync is None else fsync
+        self.compact_after = compact_after
+
+        self.lock = threading.Lock()
+        self.compaction: threading.Thread | None = None
+        self.file = None
+        self.segment_id = 0
+
+        os.makedirs(directory, exist_ok=True)
+
+    def segment_path(self, segment_id: int) -> str:
+        return os.path.join(
+            self.directory, f"{SEGMENT_PREFIX}{segment_id:08d}{SEGMENT_SUFFIX}"
+        )
+
+    def segment_ids(self) -> list[int]:
+        """Return the ids of all segment files in the log directory."""
+
+        ids = []
+        for filename in os.listdir(self.directory):
+            if filename.startswith(SEGMENT_PREFIX) and filename.endswith(
+                SEGMENT_SUFFIX
+            ):
+                ids.append(int(filename[len(SEGMENT_PREFIX) : -len(SEGMENT_SUFFIX)]))
+        return sorted(ids)
+
+    def attach(self, buffer: Buffer) -> None:
+        """Recover the logged entries into the buffer and log its changes."""
+
+        buffer.storage.extend(self.recover())
+        self.open_segment(max(self.segment_ids(), default=0) + 1)
+        # Every session starts a new segment, so short sessions would never
+        # fill one up and trigger a compaction on rotation.
+        self.compact_closed_segments()
+        buffer.add_listener(self)
+
+    def load_snapshot(self) -> tuple[int, List[dict]]:
+        """Return the last segment folded into the snapshot and its records."""
+
+        try:
+            with open(
+                os.path.join(self.directory, SNAPSHOT_NAME), mode="r", encoding="utf-8"
+            ) as infile:
+                snapshot = json.load(infile)
+        except FileNotFoundError:
+            return 0, []
+        return snapshot["segment"], snapshot["data"]
+
+    def read_segment(self, segment_id: int) -> List[dict]:
+        """Read the valid records of a segment.
+
+        A torn or corrupted record ends the segment; it is cut off so the
+        file holds only valid records."""
+
+        records = []
+        path = self.segment_path(segment_id)
+
+        with open(path, mode="rb") as infile:
+            data = infile.read()
+
+        position = 0
+        while position + RECORD_HEADER.size <= len(data):
+            length, checksum = RECORD_HEADER.unpack_from(data, position)
+            start = position + RECORD_HEADER.size
+            payload = data[start : start + length]
+            if len(payload) != length or zlib.crc32(payload) != checksum:
+                break
+            records.append(json.loads(payload))
+            position = start + length
+
+        if position != len(data):
+            print(f"Log segment {path} is damaged, dropping {len(data) - position} B.")
+            with open(path, mode="r+b") as outfile:
+                outfile.truncate(position)
+
+        return records
+
+    @staticmethod
+    def apply(records: List[dict], entries: List[dict]) -> None:
+        """Apply logged operations to the list of live entries."""
+
+        for record in records:
+            if record["op"] == "clear":
+                entries.clear()
+            else:
+                entries.append(record["text"])
+
+    def recover(self) -> List[Text]:
+        """Rebuild the live entries from the snapshot and newer segments."""
+
+        folded_segment, entries = self.load_snapshot()
+        for segment_id in self.segment_ids():
+            if segment_id > folded_segment:
+                self.apply(self.read_segment(segment_id), entries)
+        return [Text(**entry) for entry in entries]
+
+    def open_segment(self, segment_id: int) -> None:
+        self.segment_id = segment_id
+        self.file = open(self.segment_path(segment_id), mode="ab")
+
+    def append(self, records: List[dict]) -> None:
+        """Append the records and rotate the segment when it is full."""
+
+        data = bytearray()
+        for record in records:
+            payload = json.dumps(record).encode("utf-8")
+            data += RECORD_HEADER.pack(len(payload), zlib.crc32(payload))
+            data += payload
+
+        with self.lock:
+            self.file.write(data)
+            self.file.flush()
+            if self.fsync:
+                os.fsync(self.file.fileno())
+
+            if self.file.tell() >= self.segment_size:
+                self.rotate()
+
+    def rotate(self) -> None:
+        """Start a new segment and compact the closed ones when needed."""
+
+        self.file.close()
+        self.open_segment(self.segment_id + 1)
+        self.compact_closed_segments()
+
+    def compact_closed_segments(self) -> None:
+        """Compact in the background once enough segments are closed."""
+
+        closed_segments = [
+            segment_id
+            for segment_id in self.segment_ids()
+            if segment_id < self.segment_id
+        ]
+        compacting = self.compaction and self.compaction.is_alive()
+        if len(closed_segments) >= self.compact_after and not compacting:
+            self.compaction = threading.Thread(
+                target=self.compact, args=(self.segment_id - 1,)
+            )
+            self.compaction.start()
+
+    def compact(self, last_segment: int) -> None:
+        """Fold the snapshot and segments up to `last_segment` into a snapshot."""
+
+        folded_segment, entries = self.load_snapshot()
+        segments = [
+            segment_id
+            for segment_id in self.segment_ids()
+            if folded_segment < segment_id <= last_segment
+        ]
+        for segment_id in segments:
+            self.apply(self.read_segment(segment_id), entries)
+
+        filename = os.path.join(self.directory, SNAPSHOT_NAME)
+        with open(f"{filename}.tmp", mode="w", encoding="utf-8") as outfile:
+            json.dump({"segment": last_segment, "data": entries}, outfile)
+            outfile.flush()
+            os.fsync(outfile.fileno())
+        os.replace(f"{filename}.tmp", filename)
+
+        for segment_id in self.segment_ids():
+            if segment_id <= last_segment:
+                os.remove(self.segment_path(segment_id))
+
+    def texts_added(self, texts: List[Text]) -> None:
+        self.append([{"op": "add", "text": asdict(text)} for text in texts])
+
+    def buffer_cleared(self) -> None:
+        self.append([{"op": "clear"}])
+
+    def close(self) -> None:
+        """Wait for a running compaction and close the active segment."""
+
+        if self.compaction:
+            self.compaction.join()
+        if self.file:
+            self.file.close()
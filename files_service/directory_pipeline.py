@@ -0,0 +1,329 @@
+# python -m files_service.directory_pipeline SOURCE_DIR TARGET_DIR --cipher rot13
+
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+
+from cipher.cipher import CipherFacade, redact_cipher_type
+from settings import get_settings
+
+MANIFEST_NAME = ".cipher_manifest.json"
+# Iterations of the salted cipher type digest, slow enough to make guessing
+# short keys from a manifest expensive.
+DIGEST_ITERATIONS = 100_000
+OPERATIONS = ["encrypt", "decrypt"]
+
+
+@dataclass
+class FileResult:
+    """Result of processing a single file of the directory."""
+
+    path: str
+    size: int = 0
+    seconds: float = 0.0
+    skipped: bool = False
+    error: str | None = None
+
+    @property
+    def throughput(self) -> float:
+        """Processed bytes per second."""
+
+        return self.size / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class PipelineReport:
+    """Per-file results and totals of a directory run."""
+
+    results: list[FileResult] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def processed(self) -> list[FileResult]:
+        return [r for r in self.results if not r.skipped and r.error is None]
+
+    @property
+    def skipped(self) -> list[FileResult]:
+        return [r for r in self.results if r.skipped]
+
+    @property
+    def failed(self) -> list[FileResult]:
+        return [r for r in self.results if r.error is not None]
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(result.size for result in self.processed)
+
+    @property
+    def throughput(self) -> float:
+        """Processed bytes per second of wall time."""
+
+        return self.total_bytes / self.seconds if self.seconds else 0.0
+
+    def display(self) -> None:
+        """Display the per-file results and the totals."""
+
+        for result in self.results:
+            if result.skipped:
+                print(f"SKIPPED {result.path}")
+            elif result.error:
+                print(f"FAILED  {result.path}: {result.error}")
+            else:
+                print(
+                    f"OK      {result.path}: {result.size} B in "
+                    f"{result.seconds * 1000:.1f} ms "
+                    f"({result.throughput / 1024 / 1024:.2f} MiB/s)"
+                )
+
+        print(
+            f"Processed {len(self.processed)} files ({self.total_bytes} B), "
+            f"skipped {len(self.skipped)}, failed {len(self.failed)} "
+            f"in {self.seconds:.2f} s ({self.throughput / 1024 / 1024:.2f} MiB/s)"
+        )
+
+
+def process_file(
+    source: str, target: str, cipher_type: str, operation: str, chunk_size: int
+) -> tuple[int, float]:
+    """Encrypt or decrypt a file into the target path.
+
+    Runs in the worker processes. Files are read chunk by chunk, as bytes
+    for ciphers that support them and as text otherwise; undecodable bytes
+    of text files are carried through unchanged thanks to the
+    surrogateescape error handler."""
+
+    start = time.perf_counter()
+    cipher = CipherFacade(get_settings().rot13_alphabets).check_cipher_type(cipher_type)
+    stream = cipher.stream(decrypt=operation == "decrypt")
+
+    if cipher.supports_bytes:
+        read_mode, write_mode, options = "rb", "wb", {}
+    else:
+        read_mode, write_mode = "r", "w"
+        options = {"encoding": "utf-8", "errors": "surrogateescape", "newline": ""}
+
+    # A unique temporary file per call, so workers never share an output path.
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    descriptor, temporary_target = tempfile.mkstemp(
+        dir=os.path.dirname(target), prefix=f".{os.path.basename(target)}."
+    )
+
+    try:
+        with open(descriptor, mode=write_mode, **options) as outfile:
+            with open(source, mode=read_mode, **options) as infile:
+                while chunk := infile.read(chunk_size):
+                    outfile.write(stream.update(chunk))
+
+        shutil.copymode(source, temporary_target)
+        os.replace(temporary_target, target)
+    except BaseException:
+        os.remove(temporary_target)
+        raise
+
+    return os.path.getsize(source), time.perf_counter() - start
+
+
+class DirectoryPipeline:
+    """Encrypt or decrypt all files of a directory tree into a mirrored tree.
+
+    Files are processed in parallel by a process pool. A manifest in the
+    target directory remembers the size and mtime of processed files, so
+    unchanged files are skipped on the next run."""
+
+    def __init__(
+        self,
+        cipher_type: str,
+        operation: str = "encrypt",
+        workers: int | None = None,
+        chunk_size: int | None = None,
+    ) -> None:
+
+        CipherFacade().check_cipher_type(cipher_type)
+        if operation not in OPERATIONS:
+            raise ValueError(
+                f"Invalid operation {operation}. Available operations: "
+                f"{', '.join(OPERATIONS)}."
+            )
+
+        settings = get_settings()
+        self.cipher_type = cipher_type
+        self.operation = operation
+        self.workers = workers or settings.workers
+        self.chunk_size = chunk_size or settings.chunk_size
+
+    def find_files(self, source_dir: str, target_dir: str) -> list[str]:
+        """Return paths of all files in the source tree, relative to it.
+
+        The target tree and manifests of earlier runs are left out."""
+
+        target_dir = os.path.abspath(target_dir)
+        paths = []
+
+        for directory, subdirectories, filenames in os.walk(source_dir):
+            subdirectories[:] = [
+                name
+                for name in sorted(subdirectories)
+                if os.path.abspath(os.path.join(directory, name)) != target_dir
+            ]
+            for filename in sorted(filenames):
+                if filename == MANIFEST_NAME:
+                    continue
+                path = os.path.join(directory, filename)
+                paths.append(os.path.relpath(path, source_dir))
+
+        return paths
+
+    def cipher_digest(self, salt: bytes) -> str:
+        """Salted digest of the full cipher type including the key.
+
+        The manifest stores the cipher type without its key next to this
+        digest, so a run with another key still reprocesses every file."""
+
+        return hashlib.pbkdf2_hmac(
+            "sha256", self.cipher_type.encode("utf-8"), salt, DIGEST_ITERATIONS
+        ).hex()
+
+    def load_manifest(self, target_dir: str) -> dict[str, dict[str, int]]:
+        """Load the files of the previous run with the same cipher settings."""
+
+        try:
+            with open(
+                os.path.join(target_dir, MANIFEST_NAME), mode="r", encoding="utf-8"
+            ) as infile:
+                manifest = json.load(infile)
+            salt = bytes.fromhex(manifest.get("cipher_salt", ""))
+        except (FileNotFoundError, json.decoder.JSONDecodeError, ValueError):
+            return {}
+
+        if (
+            manifest.get("cipher_type") != redact_cipher_type(self.cipher_type)
+            or manifest.get("operation") != self.operation
+            or not hmac.compare_digest(
+                manifest.get("cipher_digest", ""), self.cipher_digest(salt)
+            )
+        ):
+            return {}
+        return manifest.get("files", {})
+
+    def save_manifest(self, target_dir: str, files: dict[str, dict[str, int]]):
+        """Save the processed files atomically."""
+
+        filename = os.path.join(target_dir, MANIFEST_NAME)
+        salt = os.urandom(16)
+        manifest = {
+            "cipher_type": redact_cipher_type(self.cipher_type),
+            "cipher_salt": salt.hex(),
+            "cipher_digest": self.cipher_digest(salt),
+            "operation": self.operation,
+            "files": files,
+        }
+
+        with open(f"{filename}.tmp", mode="w", encoding="utf-8") as outfile:
+            json.dump(manifest, outfile, indent=4)
+        os.replace(f"{filename}.tmp", filename)
+
+    def run(self, source_dir: str, target_dir: str) -> PipelineReport:
+        """Process the changed files of the source tree into the target tree."""
+
+        start = time.perf_counter()
+        os.makedirs(target_dir, exist_ok=True)
+
+        previous_files = self.load_manifest(target_dir)
+        files: dict[str, dict[str, int]] = {}
+        report = PipelineReport()
+        pending: dict[str, dict[str, int]] = {}
+
+        for path in self.find_files(source_dir, target_dir):
+            stat = os.stat(os.path.join(source_dir, path))
+            state = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+            if previous_files.get(path) == state and os.path.exists(
+                os.path.join(target_dir, path)
+            ):
+                files[path] = state
+                report.results.append(FileResult(path, stat.st_size, skipped=True))
+            else:
+                pending[path] = state
+
+        for result in self.process(source_dir, target_dir, list(pending)):
+            if result.error is None:
+                files[result.path] = pending[result.path]
+            report.results.append(result)
+
+        self.save_manifest(target_dir, files)
+        report.results.sort(key=lambda result: result.path)
+        report.seconds = time.perf_counter() - start
+        return report
+
+    def process(
+        self, source_dir: str, target_dir: str, paths: list[str]
+    ) -> list[FileResult]:
+        """Process the files, in a process pool when more workers are set."""
+
+        def arguments(path):
+            return (
+                os.path.join(source_dir, path),
+                os.path.join(target_dir, path),
+                self.cipher_type,
+                self.operation,
+                self.chunk_size,
+            )
+
+        results = []
+
+        if self.workers == 1 or len(paths) <= 1:
+            for path in paths:
+                try:
+                    size, seconds = process_file(*arguments(path))
+                    results.append(FileResult(path, size, seconds))
+                except (OSError, ValueError) as e:
+                    results.append(FileResult(path, error=str(e)))
+            return results
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(process_file, *arguments(path)): path for path in paths
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    size, seconds = future.result()
+                    results.append(FileResult(path, size, seconds))
+                except (OSError, ValueError) as e:
+                    results.append(FileResult(path, error=str(e)))
+
+        return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Encrypt or decrypt all files of a directory tree"
+    )
+    parser.add_argument("source", help="Directory with the input files")
+    parser.add_argument("target", help="Directory for the output files")
+    parser.add_argument("--cipher", default="rot13", help="Cipher type")
+    parser.add_argument("--decrypt", action="store_true", help="Decrypt the files")
+    parser.add_argument("--workers", type=int, help="Number of worker processes")
+    args = parser.parse_args(argv)
+
+    pipeline = DirectoryPipeline(
+        args.cipher,
+        operation="decrypt" if args.decrypt else "encrypt",
+        workers=args.workers,
+    )
+    report = pipeline.run(args.source, args.target)
+    report.display()
+
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
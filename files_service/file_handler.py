@@ -1,6 +1,16 @@
-from dataclasses import asdict
+from itertools import chain
+from typing import Iterable
 import json
-from buffer.buffer import Buffer
+import os
+from buffer.buffer import Buffer, SaveMark
+from buffer.text import Text
+from files_service.serializers import (
+    FILE_FOOTER,
+    RECORD_SEPARATOR,
+    format_record,
+    iter_json,
+    text_to_record,
+)
 
 
 class FileHandler:
@@ -10,9 +20,15 @@ class FileHandler:
     def buffer_to_dict(buffer: Buffer) -> list[dict[str, str]]:
         """Convert buffer storage to a list of dictionaries for JSON format."""
 
-        list_of_dicts = [asdict(text) for text in buffer.storage]
+        list_of_dicts = [FileHandler.text_to_dict(text) for text in buffer.storage]
         return list_of_dicts
 
+    @staticmethod
+    def text_to_dict(text: Text) -> dict[str, str]:
+        """Convert a Text to a dictionary, leaving out empty pipeline steps."""
+
+        return text_to_record(text)
+
     @staticmethod
     def get_filename(filename: str | None) -> str:
         """Get filename from user input and ensure it has a .json extension."""
@@ -25,11 +41,68 @@ class FileHandler:
 
         return filename
 
+    @staticmethod
+    def format_records(records: list[dict[str, str]]) -> str:
+        """Format records as JSON lines of the data list, like iter_json."""
+
+        return RECORD_SEPARATOR.join(format_record(record) for record in records)
+
+    @staticmethod
+    def current_save_mark(buffer: Buffer, filename: str) -> SaveMark | None:
+        """Return the save mark if the file was not changed since that save."""
+
+        mark = buffer.get_save_mark(filename)
+        if mark is None:
+            return None
+
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+
+        if stat.st_size != mark.size or stat.st_mtime_ns != mark.mtime_ns:
+            return None
+        return mark
+
+    @staticmethod
+    def append_records(
+        filename: str, records: list[dict[str, str]], has_records: bool
+    ) -> None:
+        """Append records to a file written by FileHandler by moving its footer."""
+
+        footer = FILE_FOOTER.encode("utf-8")
+        content = FileHandler.format_records(records)
+        if has_records and records:
+            content = RECORD_SEPARATOR + content
+
+        with open(filename, mode="r+b") as outfile:
+            outfile.seek(-len(footer), os.SEEK_END)
+            if outfile.read() != footer:
+                raise ValueError(f"File {filename} was not written by FileHandler.")
+
+            outfile.seek(-len(footer), os.SEEK_END)
+            outfile.truncate()
+            outfile.write(content.encode("utf-8") + footer)
+
+    @staticmethod
+    def write_records(
+        filename: str, records: Iterable[dict[str, str]], mode: str
+    ) -> None:
+        """Write a complete file with the records, streaming them in chunks."""
+
+        with open(filename, f"{mode}b") as outfile:
+            for chunk in iter_json(records):
+                outfile.write(chunk)
+
     @staticmethod
     def save_to_file(buffer: Buffer, filename: str, mode: str = "a") -> None:
-        """Saving data from buffer to file."""
+        """Saving data from buffer to file.
+
+        Only entries added since the last save of the buffer to the same file
+        are written, as long as the file was not changed in the meantime.
+        In 'w' mode the file is rewritten after the buffer was cleared,
+        in 'a' mode the new entries are appended to the existing data."""
 
-        data_to_save = FileHandler.buffer_to_dict(buffer)
         filename = FileHandler.get_filename(filename)
 
         if mode not in ["w", "a"]:
@@ -37,11 +110,63 @@ class FileHandler:
             mode = "a"
 
         try:
-            with open(filename, mode, encoding="utf-8") as outfile:
-                json.dump({'data': data_to_save}, outfile, indent=4)
+            mark = FileHandler.current_save_mark(buffer, filename)
+            # In 'w' mode the file may only be extended when it holds exactly
+            # the entries saved so far, e.g. not after merging into old data.
+            file_is_buffer = (
+                mark is not None
+                and mark.generation == buffer.generation
+                and mark.records == mark.count
+            )
+
+            if mark and (file_is_buffer or mode == "a"):
+                start = mark.count if mark.generation == buffer.generation else 0
+                records = [
+                    FileHandler.text_to_dict(text) for text in buffer.storage[start:]
+                ]
+                FileHandler.append_records(filename, records, mark.records > 0)
+                total_records = mark.records + len(records)
+
+            elif mode == "a" and os.path.isfile(filename) and os.path.getsize(filename):
+                with open(filename, mode="r", encoding="utf-8") as infile:
+                    existing_records = json.load(infile)["data"]
+
+                records = chain(
+                    existing_records, map(FileHandler.text_to_dict, buffer.storage)
+                )
+                FileHandler.write_records(filename, records, "w")
+                total_records = len(existing_records) + len(buffer.storage)
+
+            else:
+                records = map(FileHandler.text_to_dict, buffer.storage)
+                FileHandler.write_records(filename, records, mode)
+                total_records = len(buffer.storage)
+
+            FileHandler.update_save_mark(buffer, filename, total_records)
             print(f"Data successfully saved to {filename}")
         except FileNotFoundError:
             print(f"File {filename} not found.")
+        except json.decoder.JSONDecodeError:
+            print(f"File {filename} is not valid JSON.")
+
+    @staticmethod
+    def update_save_mark(buffer: Buffer, filename: str, records: int) -> None:
+        """Remember how much of the buffer is stored in the file."""
+
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            buffer.set_save_mark(filename, None)
+            return
+
+        mark = SaveMark(
+            generation=buffer.generation,
+            count=len(buffer.storage),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            records=records,
+        )
+        buffer.set_save_mark(filename, mark)
 
     @staticmethod
     def load_from_file(buffer: Buffer, filename: str) -> None:
@@ -53,7 +178,7 @@ class FileHandler:
             with open(filename, mode="r", encoding="utf-8") as infile:
                 data_to_load = json.load(infile)
 
-                buffer.add_bulk(data_to_load)
+                buffer.add_bulk(data_to_load["data"])
 
         except FileNotFoundError:
             print(f"File {filename} not found.")
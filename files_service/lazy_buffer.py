@@ -0,0 +1,175 @@
+import json
+from array import array
+from collections import OrderedDict
+from itertools import accumulate
+from typing import Iterator
+
+from buffer.text import Text
+from files_service.serializers import FILE_FOOTER, FILE_HEADER
+from settings import get_settings
+
+PAGE_SIZE = 1024
+
+
+class LazyBuffer:
+    """Read-only view of a saved buffer file that decodes entries on access.
+
+    Opening the file only records the offset of every record. Text objects
+    are decoded a page of records at a time when they are accessed, and only
+    the most recently used pages are kept in memory. Files that were not
+    written by FileHandler are parsed up front, but their Text objects are
+    still created on access."""
+
+    def __init__(
+        self, filename: str, page_size: int = PAGE_SIZE, cache_pages: int | None = None
+    ) -> None:
+
+        self.filename = filename
+        self.page_size = page_size
+        self.cache_pages = cache_pages or get_settings().cache_size
+        self.pages: OrderedDict[int, list[Text]] = OrderedDict()
+        self.offsets = array("q")
+        self.records: list[dict[str, str]] | None = None
+
+        self.file = open(filename, mode="rb")
+        try:
+            self.build_index()
+        except Exception:
+            self.file.close()
+            raise
+
+    def __enter__(self) -> "LazyBuffer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        if self.records is not None:
+            return len(self.records)
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> Text:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("LazyBuffer index out of range")
+
+        if self.records is not None:
+            return Text(**self.records[index])
+
+        page = self.load_page(index // self.page_size)
+        return page[index % self.page_size]
+
+    def __iter__(self) -> Iterator[Text]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def close(self) -> None:
+        """Close the file and drop the cached pages."""
+
+        self.file.close()
+        self.pages.clear()
+
+    def build_index(self) -> None:
+        """Record the start offset of every record line.
+
+        FileHandler writes one record per line between a fixed header and
+        footer; any other JSON layout falls back to a full parse."""
+
+        header = FILE_HEADER.encode("utf-8")
+        footer = FILE_FOOTER.encode("utf-8")
+
+        size = self.file.seek(0, 2)
+        self.file.seek(0)
+        start = self.file.read(len(header))
+        self.file.seek(max(size - len(footer), 0))
+        end = self.file.read()
+
+        if start != header or end != footer or size < len(header) + len(footer):
+            self.file.seek(0)
+            self.records = json.load(self.file)["data"]
+            return
+
+        region_end = size - len(footer)
+        position = line_start = len(header)
+        self.file.seek(position)
+        chunk_size = get_settings().chunk_size
+        remainder = b""
+
+        while position < region_end:
+            chunk = self.file.read(min(chunk_size, region_end - position))
+            if not chunk:
+                break
+            position += len(chunk)
+            lines = (remainder + chunk).splitlines(keepends=True)
+            remainder = lines.pop() if not lines[-1].endswith(b"\n") else b""
+
+            self.offsets.extend(accumulate(map(len, lines), initial=line_start))
+            line_start = self.offsets.pop()
+
+        # The last record is not followed by a newline, the footer starts with one.
+        if remainder:
+            self.offsets.append(line_start)
+        self.offsets.append(region_end)
+
+    def read_lines(self, first: int, last: int) -> list[bytes]:
+        """Read the raw record lines from `first` up to `last` (excluded)."""
+
+        start, end = self.offsets[first], self.offsets[last]
+        self.file.seek(start)
+        return self.file.read(end - start).splitlines()
+
+    @staticmethod
+    def decode(line: bytes) -> Text:
+        return Text(**json.loads(line.strip().rstrip(b",")))
+
+    def load_page(self, page_number: int) -> list[Text]:
+        """Return the decoded page, reading it from the file on a cache miss."""
+
+        if page_number in self.pages:
+            self.pages.move_to_end(page_number)
+            return self.pages[page_number]
+
+        first = page_number * self.page_size
+        last = min(first + self.page_size, len(self))
+        page = [self.decode(line) for line in self.read_lines(first, last)]
+
+        self.pages[page_number] = page
+        if len(self.pages) > self.cache_pages:
+            self.pages.popitem(last=False)
+        return page
+
+    def tail(self, count: int) -> list[Text]:
+        """Return the last `count` entries."""
+
+        return [self[index] for index in range(max(len(self) - count, 0), len(self))]
+
+    def filter(self, rot_type: str) -> Iterator[Text]:
+        """Yield entries of the cipher type, decoding only the matching ones."""
+
+        if self.records is not None:
+            for record in self.records:
+                if record["rot_type"] == rot_type:
+                    yield Text(**record)
+            return
+
+        needle = f'"rot_type": {json.dumps(rot_type)}'.encode("utf-8")
+        for first in range(0, len(self), self.page_size):
+            last = min(first + self.page_size, len(self))
+            for line in self.read_lines(first, last):
+                if needle in line:
+                    text = self.decode(line)
+                    if text.rot_type == rot_type:
+                        yield text
+
+    def display(self) -> None:
+        """Display the content of the buffer file."""
+
+        if not len(self):
+            print("Buffer empty")
+            return
+
+        print("Buffer content:")
+        for i, item in enumerate(self, 1):
+            print(f"{i}. ROT:[{item.rot_type}], STATUS[{item.status}]: {item.content}")
@@ -0,0 +1,162 @@
+# python -m files_service.serializers buffer.json --format csv > buffer.csv
+
+import argparse
+import csv
+import io
+import json
+import sys
+from dataclasses import asdict
+from typing import Callable, Iterable, Iterator
+
+from buffer.text import Text
+from settings import get_settings
+
+# Files are written with one record per line between a fixed header and
+# footer, so new records can be appended by rewriting only the footer.
+FILE_HEADER = '{\n    "data": [\n'
+FILE_FOOTER = "\n    ]\n}\n"
+RECORD_INDENT = " " * 8
+RECORD_SEPARATOR = ",\n"
+
+CSV_FIELDS = ["content", "rot_type", "status", "steps"]
+
+
+def text_to_record(text: Text) -> dict[str, str]:
+    """Convert a Text to a dictionary, leaving out empty pipeline steps."""
+
+    record = asdict(text)
+    if not record["steps"]:
+        del record["steps"]
+    return record
+
+
+def format_record(record: dict) -> str:
+    """Format a record as one line of the data list of the JSON layout."""
+
+    return RECORD_INDENT + json.dumps(record)
+
+
+def batched(parts: Iterable[str], chunk_size: int | None = None) -> Iterator[bytes]:
+    """Join the parts into UTF-8 chunks of about `chunk_size` characters."""
+
+    chunk_size = chunk_size or get_settings().chunk_size
+    batch: list[str] = []
+    size = 0
+
+    for part in parts:
+        batch.append(part)
+        size += len(part)
+        if size >= chunk_size:
+            yield "".join(batch).encode("utf-8")
+            batch.clear()
+            size = 0
+
+    if batch:
+        yield "".join(batch).encode("utf-8")
+
+
+def iter_json(
+    records: Iterable[dict], chunk_size: int | None = None
+) -> Iterator[bytes]:
+    """Yield the records in the JSON layout written by FileHandler."""
+
+    def parts():
+        yield FILE_HEADER
+        separator = ""
+        for record in records:
+            yield separator + format_record(record)
+            separator = RECORD_SEPARATOR
+        yield FILE_FOOTER
+
+    return batched(parts(), chunk_size)
+
+
+def iter_jsonl(
+    records: Iterable[dict], chunk_size: int | None = None
+) -> Iterator[bytes]:
+    """Yield the records as JSON lines, one record per line."""
+
+    return batched((json.dumps(record) + "\n" for record in records), chunk_size)
+
+
+def iter_csv(records: Iterable[dict], chunk_size: int | None = None) -> Iterator[bytes]:
+    """Yield the records as CSV rows with a header row.
+
+    Pipeline steps are joined with '+', like cipher types in the menu."""
+
+    chunk_size = chunk_size or get_settings().chunk_size
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(CSV_FIELDS)
+
+    for record in records:
+        writer.writerow(
+            [
+                record.get("content", ""),
+                record.get("rot_type", ""),
+                record.get("status", ""),
+                "+".join(record.get("steps", [])),
+            ]
+        )
+        if output.tell() >= chunk_size:
+            yield output.getvalue().encode("utf-8")
+            output.seek(0)
+            output.truncate()
+
+    if output.tell():
+        yield output.getvalue().encode("utf-8")
+
+
+SERIALIZERS: dict[str, Callable[..., Iterator[bytes]]] = {
+    "json": iter_json,
+    "jsonl": iter_jsonl,
+    "csv": iter_csv,
+}
+
+
+def export(
+    texts: Iterable[Text],
+    target,
+    format: str = "json",
+    chunk_size: int | None = None,
+) -> int:
+    """Stream the texts to a binary file, pipe or socket.
+
+    Records are serialized one by one and written in chunks of about
+    `chunk_size` characters, so the export never holds more than one
+    chunk in memory. Returns the number of written bytes."""
+
+    if format not in SERIALIZERS:
+        raise ValueError(
+            f"Invalid format {format}. Available formats: {', '.join(SERIALIZERS)}."
+        )
+
+    write = target.sendall if hasattr(target, "sendall") else target.write
+    records = (text_to_record(text) for text in texts)
+    written = 0
+
+    for chunk in SERIALIZERS[format](records, chunk_size):
+        write(chunk)
+        written += len(chunk)
+
+    return written
+
+
+def main(argv: list[str] | None = None) -> int:
+    # Imported here because LazyBuffer imports the file layout from this module.
+    from files_service.lazy_buffer import LazyBuffer
+
+    parser = argparse.ArgumentParser(description="Export a saved buffer file to stdout")
+    parser.add_argument("filename", help="Buffer file saved by the application")
+    parser.add_argument("--format", default="json", choices=list(SERIALIZERS))
+    args = parser.parse_args(argv)
+
+    with LazyBuffer(args.filename) as texts:
+        export(texts, sys.stdout.buffer, args.format)
+    sys.stdout.flush()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,20 +2,34 @@
 # python main.py
 
 from manager.manager import Manager
+from manager.profiler import ActionProfiler
 from cipher.cipher import CipherFacade
 from buffer.buffer import Buffer
 from files_service.file_handler import FileHandler
+from files_service.buffer_log import BufferLog
 from menu.menu_items import MainMenu
+from settings import get_settings
 
 
 def main():
-    cipher = CipherFacade()
+    cipher = CipherFacade(get_settings().rot13_alphabets)
     buffer = Buffer()
     file_handler = FileHandler()
     menu = MainMenu()
 
-    manager = Manager(cipher, buffer, file_handler, menu)
-    manager.run()
+    profiler = ActionProfiler.from_settings()
+
+    buffer_log = None
+    if get_settings().log_dir:
+        buffer_log = BufferLog(get_settings().log_dir)
+        buffer_log.attach(buffer)
+
+    manager = Manager(cipher, buffer, file_handler, menu, profiler)
+    try:
+        manager.run()
+    finally:
+        if buffer_log:
+            buffer_log.close()
 
 
 if __name__ == "__main__":
@@ -1,8 +1,12 @@
-from cipher.cipher import CipherFacade, CipherNotFoundError
+from functools import cached_property
+
+from cipher.cipher import CipherFacade, CipherNotFoundError, redact_cipher_type
+from cipher.pipeline import CipherPipeline
 from buffer.buffer import Buffer
 from files_service.file_handler import FileHandler
 from menu.menu_items import MainMenu
-from settings import DEBUG
+from manager.profiler import ActionProfiler
+from settings import get_settings
 
 
 class Manager:
@@ -15,16 +19,20 @@ class Manager:
         buffer: Buffer,
         file_handler: FileHandler,
         menu: MainMenu,
+        profiler: ActionProfiler | None = None,
     ) -> None:
 
         self.cipher_facade = cipher_facade
         self.buffer = buffer
         self.file_handler = file_handler
         self.menu = menu
+        self.profiler = profiler
         self.is_running = True
 
-    @property
+    @cached_property
     def actions(self):
+        """Menu choices mapped to actions, built once on the first access."""
+
         return {
             1: self.encrypt_text,
             2: self.decrypt_text,
@@ -64,7 +72,14 @@ class Manager:
                 print(f"Invalid operation type: {operation_type}")
                 return
 
-            self.buffer.add(content=text, rot_type=cipher_type, status=status)
+            # Keys of keyed ciphers are never stored next to the ciphertext.
+            steps = cipher.steps if isinstance(cipher, CipherPipeline) else None
+            self.buffer.add(
+                content=text,
+                rot_type=redact_cipher_type(cipher_type),
+                status=status,
+                steps=steps,
+            )
 
             print(f"Text {operation_type}ed successfully: {text}")
             print(f"Added to buffer with status '{status}'")
@@ -72,7 +87,7 @@ class Manager:
         except CipherNotFoundError as e:
             print(f"Cipher error: {str(e)}")
         except Exception as e:
-            if DEBUG:
+            if get_settings().debug:
                 print(f"Error: {e}")
             print(f"Error during {operation_type} operation try again.")
 
@@ -125,6 +140,14 @@ class Manager:
         print("\nExiting application. Goodbye!")
         self.is_running = False
 
+    def run_action(self, action):
+        """Run the action, under the profiler when profiling is enabled."""
+
+        if self.profiler:
+            self.profiler.run(action)
+        else:
+            action()
+
     def run(self):
         """Map the menu choice to the appropriate function."""
 
@@ -134,6 +157,6 @@ class Manager:
             choice = self.menu.get_choice()
 
             if choice in self.actions:
-                self.actions[choice]()
+                self.run_action(self.actions[choice])
             else:
                 print(f"Invalid choice: {choice}")
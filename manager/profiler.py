@@ -0,0 +1,98 @@
+import cProfile
+import os
+import time
+import tracemalloc
+from typing import Callable
+
+from settings import get_settings
+
+
+class ActionProfiler:
+    """Run Manager actions under cProfile and tracemalloc.
+
+    Every profiled action writes a `.prof` file (open it with pstats or
+    snakeviz) and a text report with the top allocations."""
+
+    def __init__(
+        self,
+        output_dir: str = "profiles",
+        top: int = 20,
+        cpu: bool = True,
+        memory: bool = True,
+    ) -> None:
+
+        self.output_dir = output_dir
+        self.top = top
+        self.cpu = cpu
+        self.memory = memory
+        self.runs = 0
+
+    @classmethod
+    def from_settings(cls) -> "ActionProfiler | None":
+        """Create a profiler when profiling is enabled with PROFILE=true."""
+
+        settings = get_settings()
+        if not settings.profile:
+            return None
+        return cls(output_dir=settings.profile_dir, top=settings.profile_top)
+
+    def report_path(self, action_name: str) -> str:
+        """Build a unique path prefix for the reports of a single run."""
+
+        self.runs += 1
+        timestamp = time.strftime("%Y%m%d-%H%M%S")
+        filename = f"{action_name}-{timestamp}-{self.runs}"
+        return os.path.join(self.output_dir, filename)
+
+    def run(self, action: Callable[[], None]) -> None:
+        """Run the action and save its CPU profile and allocation report."""
+
+        action_name = getattr(action, "__name__", "action")
+        path = self.report_path(action_name)
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        profiler = cProfile.Profile() if self.cpu else None
+        started_tracing = self.memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        elif self.memory:
+            # Tracing started earlier, e.g. with -X tracemalloc: report the
+            # peak of this action, not of the whole process.
+            tracemalloc.reset_peak()
+
+        try:
+            if profiler:
+                profiler.runcall(action)
+            else:
+                action()
+        finally:
+            if profiler:
+                profiler.dump_stats(f"{path}.prof")
+                print(f"CPU profile saved to {path}.prof")
+
+            if self.memory:
+                self.save_allocations(f"{path}.alloc.txt", action_name)
+                print(f"Allocation report saved to {path}.alloc.txt")
+
+            if started_tracing:
+                tracemalloc.stop()
+
+    def save_allocations(self, filename: str, action_name: str) -> None:
+        """Write the top allocations of the traced action to a text file."""
+
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, cProfile.__file__),
+            ]
+        )
+        statistics = snapshot.statistics("lineno")[: self.top]
+
+        with open(filename, mode="w", encoding="utf-8") as outfile:
+            outfile.write(f"Action: {action_name}\n")
+            outfile.write(f"Current memory: {current / 1024:.1f} KiB\n")
+            outfile.write(f"Peak memory: {peak / 1024:.1f} KiB\n")
+            outfile.write(f"Top {self.top} allocations:\n")
+            for stat in statistics:
+                outfile.write(f"{stat}\n")
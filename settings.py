@@ -1,8 +1,94 @@
-from dotenv import load_dotenv
 import os
+from dataclasses import dataclass
+from functools import cache
 
-load_dotenv()
+TRUE_VALUES = {"1", "true", "yes", "on"}
 
-DEBUG = os.getenv('DEBUG', default=False)
 
-print(DEBUG)
\ No newline at end of file
+def parse_bool(value: str | None, default: bool = False) -> bool:
+    """Parse an environment value into a boolean ("False" is false)."""
+
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() in TRUE_VALUES
+
+
+def parse_int(value: str | None, default: int) -> int:
+    """Parse an environment value into a positive integer."""
+
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return default
+    return number if number > 0 else default
+
+
+def parse_list(value: str | None) -> tuple[str, ...]:
+    """Parse a comma-separated environment value into a tuple of strings."""
+
+    if value is None:
+        return ()
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Application settings read from the environment and the .env file."""
+
+    debug: bool = False
+    workers: int = os.cpu_count() or 1
+    chunk_size: int = 64 * 1024
+    cache_size: int = 128
+    rot13_alphabets: tuple[str, ...] = ()
+    log_dir: str = ""
+    log_segment_size: int = 4 * 1024 * 1024
+    log_fsync: bool = False
+    profile: bool = False
+    profile_dir: str = "profiles"
+    profile_top: int = 20
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Create settings from environment variables."""
+
+        return cls(
+            debug=parse_bool(os.getenv("DEBUG")),
+            workers=parse_int(os.getenv("WORKERS"), cls.workers),
+            chunk_size=parse_int(os.getenv("CHUNK_SIZE"), cls.chunk_size),
+            cache_size=parse_int(os.getenv("CACHE_SIZE"), cls.cache_size),
+            rot13_alphabets=parse_list(os.getenv("ROT13_ALPHABETS")),
+            log_dir=os.getenv("LOG_DIR") or cls.log_dir,
+            log_segment_size=parse_int(
+                os.getenv("LOG_SEGMENT_SIZE"), cls.log_segment_size
+            ),
+            log_fsync=parse_bool(os.getenv("LOG_FSYNC")),
+            profile=parse_bool(os.getenv("PROFILE")),
+            profile_dir=os.getenv("PROFILE_DIR") or cls.profile_dir,
+            profile_top=parse_int(os.getenv("PROFILE_TOP"), cls.profile_top),
+        )
+
+
+def load_env_file() -> None:
+    """Load the .env file if python-dotenv is installed."""
+
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv()
+
+
+@cache
+def get_settings() -> Settings:
+    """Return the settings, loading them on the first call only."""
+
+    load_env_file()
+    return Settings.from_env()
+
+
+def __getattr__(name: str):
+    # Keeps `from settings import DEBUG` working without reading the
+    # environment when the module is imported.
+    if name == "DEBUG":
+        return get_settings().debug
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
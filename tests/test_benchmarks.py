@@ -0,0 +1,179 @@
+import json
+import pytest
+import tempfile
+from unittest.mock import patch
+from buffer.buffer import Buffer
+from files_service.buffer_log import BufferLog
+from benchmarks.runner import compare_results, main, measure, run_benchmarks
+from benchmarks.suite import Benchmark, build_suite, sample_text
+
+
+class TestBenchmarks:
+    @pytest.fixture
+    def baseline(self):
+        return {
+            "results": {
+                "cipher.rot13.ascii[100]": {"best": 1.0},
+                "buffer.add[100]": {"best": 2.0},
+            }
+        }
+
+    def test_build_suite_should_cover_ciphers_buffer_and_files(self):
+        suite = build_suite([10])
+
+        assert "cipher.rot13.ascii[10]" in suite
+        assert "cipher.rot47.unicode[10]" in suite
+        assert "cipher.rot47.binary[10]" in suite
+        assert "buffer.add[10]" in suite
+        assert "buffer.iterate[10]" in suite
+        assert "file.json_round_trip[10]" in suite
+        assert "file.full_save[10]" in suite
+        assert "file.incremental_save[10]" in suite
+        assert "backend.python.rot13[10]" in suite
+        assert "file.lazy_load[10]" in suite
+        assert "pipeline.fused[10]" in suite
+        assert "log.recover[10]" in suite
+        assert "search.index[10]" in suite
+        assert "unicode.utf8_translate.rot13[10]" in suite
+        assert "export.csv[10]" in suite
+        assert "backend.bytes_translate.rot47[10]" in suite
+
+    def test_incremental_save_should_keep_all_entries_in_file(self, tmp_path):
+        with patch("tempfile.mkdtemp", return_value=str(tmp_path)):
+            save = build_suite([3])["file.incremental_save[3]"].setup()
+
+        save()
+        save()
+
+        saved = json.loads((tmp_path / "save.json").read_text())
+        assert len(saved["data"]) == 5
+
+    def test_search_index_should_match_linear_scan(self):
+        suite = build_suite([300])
+
+        indexed = suite["search.index[300]"].setup()()
+
+        assert indexed
+        assert indexed == suite["search.scan[300]"].setup()()
+
+    def test_search_build_should_not_add_buffer_listeners(self):
+        build = build_suite([30])["search.build[30]"].setup()
+
+        with patch.object(Buffer, "add_listener") as add_listener:
+            build()
+            build()
+
+        add_listener.assert_not_called()
+
+    def test_sample_text_should_be_reproducible(self):
+        assert sample_text("unicode", 50) == sample_text("unicode", 50)
+        assert len(sample_text("binary", 50)) == 50
+
+    def test_json_round_trip_should_load_saved_buffer(self):
+        benchmark = build_suite([3])["file.json_round_trip[3]"]
+        try:
+            loaded = benchmark.setup()()
+        finally:
+            benchmark.teardown()
+
+        assert [text.content for text in loaded.storage] == [
+            "text 0",
+            "text 1",
+            "text 2",
+        ]
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "file.json_round_trip[3]",
+            "file.full_load[3]",
+            "log.append[3]",
+            "log.recover[3]",
+        ],
+    )
+    def test_measure_should_remove_temporary_directories(self, tmp_path, name):
+        mkdtemp = tempfile.mkdtemp
+        benchmark = build_suite([3])[name]
+
+        with patch(
+            "tempfile.mkdtemp",
+            side_effect=lambda prefix: mkdtemp(prefix=prefix, dir=tmp_path),
+        ):
+            measure(benchmark, repeat=1)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_log_append_should_start_every_run_from_empty_log(self, tmp_path):
+        with patch("tempfile.mkdtemp", return_value=str(tmp_path)):
+            append = build_suite([3])["log.append[3]"].setup()
+
+        append()
+        append()
+
+        texts = BufferLog(str(tmp_path / "log")).recover()
+        assert [text.content for text in texts] == ["text 0", "text 1", "text 2"]
+
+    def test_run_benchmarks_should_filter_by_pattern(self):
+        benchmarks = {
+            "a.one": Benchmark("a.one", lambda: lambda: None, 1),
+            "b.two": Benchmark("b.two", lambda: lambda: None, 1),
+        }
+
+        results = run_benchmarks(benchmarks, pattern="a.*", repeat=1)
+
+        assert list(results["results"]) == ["a.one"]
+        assert results["results"]["a.one"]["best"] >= 0
+
+    def test_compare_results_should_report_slowdown_above_threshold(self, baseline):
+        current = {
+            "results": {
+                "cipher.rot13.ascii[100]": {"best": 1.5},
+                "buffer.add[100]": {"best": 2.1},
+                "new.benchmark[100]": {"best": 9.0},
+            }
+        }
+
+        regressions = compare_results(current, baseline, threshold=10)
+
+        assert regressions == [("cipher.rot13.ascii[100]", pytest.approx(50.0))]
+
+    def test_main_compare_should_fail_on_regression(self, baseline, tmp_path):
+        baseline_file = tmp_path / "baseline.json"
+        baseline["results"]["cipher.rot13.ascii[100]"]["best"] = 1e-12
+        baseline_file.write_text(json.dumps(baseline))
+
+        with patch("builtins.print"):
+            exit_code = main(
+                [
+                    "--quick",
+                    "--repeat",
+                    "1",
+                    "--filter",
+                    "cipher.rot13.ascii*",
+                    "compare",
+                    str(baseline_file),
+                ]
+            )
+
+        assert exit_code == 1
+
+    def test_main_run_should_save_results(self, tmp_path):
+        output = tmp_path / "results.json"
+
+        with patch("builtins.print"):
+            exit_code = main(
+                [
+                    "--quick",
+                    "--repeat",
+                    "1",
+                    "--filter",
+                    "buffer.*",
+                    "run",
+                    "--output",
+                    str(output),
+                ]
+            )
+
+        saved = json.loads(output.read_text())
+        assert exit_code == 0
+        assert set(saved["results"]) == {"buffer.add[100]", "buffer.iterate[100]"}
@@ -1,6 +1,6 @@
 import pytest
-from unittest.mock import patch, call
-from buffer.buffer import Buffer
+from unittest.mock import Mock, patch, call
+from buffer.buffer import Buffer, BufferListener, SaveMark
 from buffer.text import Text
 
 
@@ -57,6 +57,38 @@ class TestBuffer:
         filled_buffer.clear_all()
         assert filled_buffer.storage == []
 
+    def test_clear_all_should_start_new_generation(self, filled_buffer):
+        filled_buffer.clear_all()
+
+        assert filled_buffer.generation == 1
+
+    def test_save_mark_should_be_stored_per_file(self, empty_buffer):
+        mark = SaveMark(generation=0, count=2, size=10, mtime_ns=1, records=2)
+
+        empty_buffer.set_save_mark("a.json", mark)
+
+        assert empty_buffer.get_save_mark("a.json") is mark
+        assert empty_buffer.get_save_mark("b.json") is None
+
+        empty_buffer.set_save_mark("a.json", None)
+        assert empty_buffer.get_save_mark("a.json") is None
+
+    def test_listeners_should_be_notified_about_changes(self, empty_buffer):
+        listener = Mock(spec=BufferListener)
+        empty_buffer.add_listener(listener)
+
+        empty_buffer.add("Test", "ROT13", "encrypted")
+        empty_buffer.add_bulk(
+            [{"content": "Bulk", "rot_type": "ROT47", "status": "decrypted"}]
+        )
+        empty_buffer.clear_all()
+
+        assert listener.mock_calls == [
+            call.texts_added([Text("Test", "ROT13", "encrypted")]),
+            call.texts_added([Text("Bulk", "ROT47", "decrypted")]),
+            call.buffer_cleared(),
+        ]
+
     def test_display_on_empty_buffer(self, empty_buffer):
         with patch("builtins.print") as mock_print:
             empty_buffer.display()
@@ -0,0 +1,149 @@
+import os
+import pytest
+from unittest.mock import patch
+from buffer.buffer import Buffer
+from buffer.text import Text
+from files_service.buffer_log import SNAPSHOT_NAME, BufferLog
+
+
+class TestBufferLog:
+    @pytest.fixture
+    def log_dir(self, tmp_path):
+        return str(tmp_path / "log")
+
+    def open_buffer(self, log_dir, **options):
+        buffer = Buffer()
+        log = BufferLog(log_dir, **options)
+        log.attach(buffer)
+        return buffer, log
+
+    def test_attach_should_recover_logged_entries(self, log_dir):
+        buffer, log = self.open_buffer(log_dir)
+        buffer.add("text1", "rot13", "encrypted")
+        buffer.add_bulk(
+            [{"content": "text2", "rot_type": "rot47", "status": "decrypted"}]
+        )
+        log.close()
+
+        recovered, recovered_log = self.open_buffer(log_dir)
+        recovered_log.close()
+
+        assert recovered.storage == [
+            Text("text1", "rot13", "encrypted"),
+            Text("text2", "rot47", "decrypted"),
+        ]
+
+    def test_recover_should_replay_clear_markers(self, log_dir):
+        buffer, log = self.open_buffer(log_dir)
+        buffer.add("old", "rot13", "encrypted")
+        buffer.clear_all()
+        buffer.add("new", "rot13", "encrypted", steps=["rot13"])
+        log.close()
+
+        recovered, recovered_log = self.open_buffer(log_dir)
+        recovered_log.close()
+
+        assert recovered.storage == [Text("new", "rot13", "encrypted", ["rot13"])]
+
+    def test_append_should_rotate_full_segments(self, log_dir):
+        buffer, log = self.open_buffer(log_dir, segment_size=100, compact_after=100)
+        for i in range(10):
+            buffer.add(f"text {i}", "rot13", "encrypted")
+        log.close()
+
+        closed_segments = log.segment_ids()[:-1]
+        assert len(closed_segments) == 10
+        assert all(len(log.read_segment(i)) == 1 for i in closed_segments)
+        assert log.read_segment(log.segment_id) == []
+
+    def test_compact_should_fold_clear_markers_and_remove_segments(self, log_dir):
+        buffer, log = self.open_buffer(log_dir, segment_size=50, compact_after=100)
+        buffer.add("old", "rot13", "encrypted")
+        buffer.clear_all()
+        buffer.add("new", "rot13", "encrypted")
+
+        log.compact(log.segment_id - 1)
+        log.close()
+
+        folded_segment, entries = log.load_snapshot()
+        assert folded_segment == log.segment_id - 1
+        assert [entry["content"] for entry in entries] == ["new"]
+        assert log.segment_ids() == [log.segment_id]
+
+    def test_rotation_should_compact_in_background(self, log_dir):
+        buffer, log = self.open_buffer(log_dir, segment_size=50, compact_after=3)
+        for i in range(5):
+            buffer.add(f"old {i}", "rot13", "encrypted")
+        buffer.clear_all()
+        for i in range(5):
+            buffer.add(f"new {i}", "rot13", "encrypted")
+        log.close()
+
+        assert os.path.exists(os.path.join(log_dir, SNAPSHOT_NAME))
+        assert len(log.segment_ids()) < 11
+
+        recovered, recovered_log = self.open_buffer(log_dir)
+        recovered_log.close()
+        assert [text.content for text in recovered.storage] == [
+            f"new {i}" for i in range(5)
+        ]
+
+    def test_attach_should_compact_segments_of_short_sessions(self, log_dir):
+        for session in range(10):
+            buffer, log = self.open_buffer(log_dir, compact_after=3)
+            for i in range(20):
+                buffer.add(f"text {session} {i}", "rot13", "encrypted")
+            buffer.clear_all()
+            log.close()
+
+        assert os.path.exists(os.path.join(log_dir, SNAPSHOT_NAME))
+        assert len(log.segment_ids()) <= 4
+
+        recovered, recovered_log = self.open_buffer(log_dir)
+        recovered_log.close()
+        assert recovered.storage == []
+
+    def test_recover_should_drop_torn_last_record(self, log_dir):
+        buffer, log = self.open_buffer(log_dir)
+        buffer.add("text1", "rot13", "encrypted")
+        buffer.add("text2", "rot13", "encrypted")
+        log.close()
+        path = log.segment_path(log.segment_id)
+        with open(path, "r+b") as segment:
+            segment.truncate(os.path.getsize(path) - 3)
+
+        with patch("builtins.print") as mock_print:
+            recovered, recovered_log = self.open_buffer(log_dir)
+        recovered.add("text3", "rot13", "encrypted")
+        recovered_log.close()
+
+        assert [text.content for text in recovered.storage] == ["text1", "text3"]
+        assert "damaged" in mock_print.call_args[0][0]
+
+        again, again_log = self.open_buffer(log_dir)
+        again_log.close()
+        assert [text.content for text in again.storage] == ["text1", "text3"]
+
+    def test_recover_should_detect_corrupted_record(self, log_dir):
+        buffer, log = self.open_buffer(log_dir)
+        buffer.add("text1", "rot13", "encrypted")
+        log.close()
+        path = log.segment_path(log.segment_id)
+        with open(path, "r+b") as segment:
+            segment.seek(-3, os.SEEK_END)
+            segment.write(b"XXX")
+
+        with patch("builtins.print"):
+            recovered, recovered_log = self.open_buffer(log_dir)
+        recovered_log.close()
+
+        assert recovered.storage == []
+
+    def test_fsync_should_sync_every_append(self, log_dir):
+        buffer, log = self.open_buffer(log_dir, fsync=True)
+
+        with patch("os.fsync") as mock_fsync:
+            buffer.add("text1", "rot13", "encrypted")
+        log.close()
+
+        mock_fsync.assert_called_once()
@@ -3,9 +3,12 @@ from unittest.mock import patch, call
 from cipher.cipher import (
     CipherROT13,
     CipherROT47,
+    CipherVigenere,
+    CipherXOR,
     CipherFacade,
     Cipher,
     CipherNotFoundError,
+    redact_cipher_type,
 )
 
 
@@ -35,6 +38,36 @@ class TestCiphers:
         result = rot13_cipher.encrypt("a1b! c")
         assert result == "n1o! p"
 
+    def test_rot13_should_keep_non_ascii_letters(self, rot13_cipher):
+        text = "Zażółć gęślą jaźń, Straße, café 😀"
+        encrypted = rot13_cipher.encrypt(text)
+
+        assert encrypted == "Mnżółć tęśyą wnźń, Fgenßr, pnsé 😀"
+        assert encrypted == rot13_cipher.python_shift(text, 13)
+        assert rot13_cipher.decrypt(encrypted) == text
+
+    def test_rot13_should_keep_lone_surrogates(self, rot13_cipher):
+        text = "abc\udc80def"
+
+        assert rot13_cipher.encrypt(text) == "nop\udc80qrs"
+
+    def test_rot13_should_rotate_extra_alphabets(self):
+        cipher = CipherROT13(["абвгдеёжзийклмнопрстуфхцчшщъыьэюя"])
+        encrypted = cipher.encrypt("привет, Hello")
+
+        assert encrypted == "ьэхося, Uryyb"
+        assert cipher.decrypt(encrypted) == "привет, Hello"
+
+    def test_facade_should_pass_extra_alphabets_to_rot13(self):
+        facade = CipherFacade(["абвгдеёжзийклмнопрстуфхцчшщъыьэюя"])
+
+        assert facade.encrypt("привет, Hello", "rot13") == "ьэхося, Uryyb"
+
+    @pytest.mark.parametrize("alphabets", [["abc"], ["αβγ", "γδ"]])
+    def test_rot13_should_reject_invalid_alphabets(self, alphabets):
+        with pytest.raises(ValueError):
+            CipherROT13(alphabets)
+
     def test_rot47_should_encrypt_and_decrypt_text(self, rot47_cipher):
         text = "Hello123!"
         encrypted = rot47_cipher.encrypt(text)
@@ -51,6 +84,13 @@ class TestCiphers:
 
         assert rot47_cipher.perform_shift(text, 47) == "w6==@\n(@C=5\t"
 
+    def test_rot47_should_match_python_implementation(self, rot47_cipher):
+        text = "".join(chr(i) for i in range(128)) + "Zażółć 😀 abc\udc80"
+
+        assert rot47_cipher.perform_shift(text, 47) == rot47_cipher.python_shift(
+            text, 47
+        )
+
     def test_facade_encrypt_with_correct_cipher_type(self, cipher_facade):
         text = "Hello World"
 
@@ -70,3 +110,120 @@ class TestCiphers:
             cipher_facade.check_cipher_type("invalid_cipher")
 
         assert str(exception_info.value)
+
+
+class TestKeyedCiphers:
+    @pytest.fixture
+    def vigenere_cipher(self):
+        return CipherVigenere("LEMON")
+
+    @pytest.fixture
+    def xor_cipher(self):
+        return CipherXOR("key")
+
+    @pytest.fixture
+    def cipher_facade(self):
+        return CipherFacade()
+
+    def test_vigenere_should_encrypt_with_key(self, vigenere_cipher):
+        assert vigenere_cipher.encrypt("ATTACKATDAWN") == "LXFOPVEFRNHR"
+        assert vigenere_cipher.encrypt("attackatdawn") == "lxfopvefrnhr"
+
+    def test_vigenere_should_keep_non_letters_without_moving_key(self, vigenere_cipher):
+        assert vigenere_cipher.encrypt("a a!") == "l e!"
+        assert vigenere_cipher.encrypt("attack at dawn") == "lxfopv ef rnhr"
+
+    def test_vigenere_should_decrypt_text_back_to_original(self, vigenere_cipher):
+        text = "Zażółć gęślą jaźń, Hello World!"
+
+        assert vigenere_cipher.decrypt(vigenere_cipher.encrypt(text)) == text
+
+    def test_vigenere_should_encrypt_bytes(self, vigenere_cipher):
+        assert vigenere_cipher.encrypt(b"ATTACKATDAWN") == b"LXFOPVEFRNHR"
+
+    def test_vigenere_should_encrypt_utf8_bytes_like_text(self, vigenere_cipher):
+        text = "Zażółć gęślą jaźń, attack at dawn!"
+
+        encrypted = vigenere_cipher.encrypt(text.encode("utf-8"))
+
+        assert encrypted == vigenere_cipher.encrypt(text).encode("utf-8")
+        assert vigenere_cipher.decrypt(encrypted) == text.encode("utf-8")
+
+    def test_vigenere_should_reject_key_with_non_letters(self):
+        with pytest.raises(ValueError):
+            CipherVigenere("key1")
+        with pytest.raises(ValueError):
+            CipherVigenere("")
+
+    def test_xor_should_encrypt_bytes_with_repeating_key(self, xor_cipher):
+        data = bytes(range(256)) * 3
+        key = b"key"
+        expected = bytes(b ^ key[i % 3] for i, b in enumerate(data))
+
+        assert xor_cipher.encrypt(data) == expected
+        assert xor_cipher.decrypt(expected) == data
+
+    def test_xor_should_round_trip_unicode_text(self, xor_cipher):
+        text = "Hello 中文 😀 żółw"
+        encrypted = xor_cipher.encrypt(text)
+
+        assert encrypted != text
+        assert xor_cipher.decrypt(encrypted) == text
+
+    @pytest.mark.parametrize(
+        "data",
+        ["Attack at dawn, again!", b"Attack at dawn!", "Zażółć at dawn".encode()],
+    )
+    def test_stream_should_match_bulk_encryption(self, vigenere_cipher, data):
+        stream = vigenere_cipher.stream()
+        chunks = [data[i : i + 4] for i in range(0, len(data), 4)]
+
+        result = data[:0].join(stream.update(chunk) for chunk in chunks)
+
+        assert result == vigenere_cipher.encrypt(data)
+
+    def test_stream_should_decrypt_chunks(self, xor_cipher):
+        encrypted = xor_cipher.encrypt(b"some longer message")
+        stream = xor_cipher.stream(decrypt=True)
+
+        result = stream.update(encrypted[:5]) + stream.update(encrypted[5:])
+
+        assert result == b"some longer message"
+
+    def test_perform_shift_should_start_at_key_position(self, vigenere_cipher):
+        assert vigenere_cipher.perform_shift("aaa", 3) == "onl"
+
+    def test_facade_should_use_keyed_cipher_with_key(self, cipher_facade):
+        encrypted = cipher_facade.encrypt("attack at dawn", "vigenere:lemon")
+
+        assert encrypted == "lxfopv ef rnhr"
+        assert cipher_facade.decrypt(encrypted, "Vigenere:lemon") == "attack at dawn"
+
+    def test_facade_should_reuse_keyed_cipher_instance(self, cipher_facade):
+        first = cipher_facade.check_cipher_type("xor:abc")
+
+        assert cipher_facade.check_cipher_type("XOR:abc") is first
+        assert cipher_facade.check_cipher_type("xor:ABC") is not first
+
+    @pytest.mark.parametrize("cipher_type", ["vigenere", "vigenere:", "vigenere:k3y"])
+    def test_facade_should_raise_error_for_missing_or_invalid_key(
+        self, cipher_facade, cipher_type
+    ):
+        with pytest.raises(CipherNotFoundError):
+            cipher_facade.check_cipher_type(cipher_type)
+
+    @pytest.mark.parametrize(
+        "cipher_type,redacted",
+        [
+            ("rot13", "rot13"),
+            ("vigenere:lemon", "vigenere"),
+            ("rot47+xor:se+cret+rot13", "rot47+xor+rot13"),
+        ],
+    )
+    def test_redact_cipher_type_should_drop_keys(self, cipher_type, redacted):
+        assert redact_cipher_type(cipher_type) == redacted
+
+    def test_rot_stream_should_encrypt_chunks(self):
+        stream = CipherROT13().stream()
+
+        assert stream.update("hel") + stream.update("lo") == "uryyb"
@@ -0,0 +1,42 @@
+import pytest
+from cipher.cipher import CipherFacade, CipherROT13
+
+pytest.importorskip("hypothesis")
+
+from hypothesis import given, strategies as st  # noqa: E402
+
+CYRILLIC = "абвгдеёжзийклмнопрстуфхцчшщъыьэюя"
+
+
+class TestCipherProperties:
+    @given(st.text())
+    def test_rot13_should_round_trip_unicode(self, text):
+        cipher = CipherROT13()
+
+        assert cipher.decrypt(cipher.encrypt(text)) == text
+
+    @given(st.text())
+    def test_rot13_should_match_reference_implementation(self, text):
+        cipher = CipherROT13()
+
+        assert cipher.encrypt(text) == cipher.python_shift(text, 13)
+
+    @given(st.text())
+    def test_rot13_should_only_change_ascii_letters(self, text):
+        encrypted = CipherROT13().encrypt(text)
+
+        assert len(encrypted) == len(text)
+        for char, encrypted_char in zip(text, encrypted):
+            assert (char == encrypted_char) != (char.isascii() and char.isalpha())
+
+    @given(st.text() | st.text(CYRILLIC + CYRILLIC.upper() + "ab "))
+    def test_rot13_with_extra_alphabet_should_round_trip(self, text):
+        cipher = CipherROT13([CYRILLIC, CYRILLIC.upper()])
+
+        assert cipher.decrypt(cipher.encrypt(text)) == text
+
+    @given(st.text())
+    def test_rot13_pipeline_should_round_trip(self, text):
+        pipeline = CipherFacade().pipeline("rot13", "rot47", "rot13")
+
+        assert pipeline.decrypt(pipeline.encrypt(text)) == text
@@ -0,0 +1,52 @@
+import pytest
+from unittest.mock import patch
+from cipher.cipher import CipherFacade, CipherROT13
+from cipher.detector import detect, histogram
+
+
+class TestDetector:
+    @pytest.fixture
+    def cipher_facade(self):
+        return CipherFacade()
+
+    @pytest.fixture
+    def plaintext(self):
+        return "Meet me near the old station at seven, and bring the letters with you."
+
+    @pytest.mark.parametrize("cipher_type", ["rot13", "rot47"])
+    def test_detect_should_rank_used_cipher_first(
+        self, cipher_facade, plaintext, cipher_type
+    ):
+        encrypted = cipher_facade.encrypt(plaintext, cipher_type)
+
+        best = cipher_facade.detect(encrypted)[0]
+
+        assert best.name == cipher_type
+        cipher = cipher_facade.check_cipher_type(best.cipher_type)
+        assert cipher.perform_shift(encrypted, best.shift) == plaintext
+
+    def test_detect_should_find_any_rot_n_shift(self, plaintext):
+        encrypted = CipherROT13().perform_shift(plaintext, 5)
+
+        best = detect(encrypted)[0]
+
+        assert best.name == "rot5"
+        assert CipherROT13().perform_shift(encrypted, best.shift) == plaintext
+
+    def test_detect_should_return_all_candidates_sorted_by_score(self, plaintext):
+        results = detect(plaintext)
+        scores = [result.score for result in results]
+
+        assert len(results) == 26
+        assert scores == sorted(scores, reverse=True)
+
+    def test_detect_should_score_only_sample_prefix(self):
+        with patch("cipher.detector.histogram", wraps=histogram) as mock_histogram:
+            detect("a" * 100 + "b" * 100, sample_size=100)
+
+        mock_histogram.assert_called_once_with("a" * 100)
+
+    def test_detect_should_handle_text_without_printable_characters(self):
+        results = detect("   \n")
+
+        assert all(result.score == 0.0 for result in results)
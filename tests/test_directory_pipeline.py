@@ -0,0 +1,178 @@
+import json
+import pytest
+from unittest.mock import patch
+from cipher.cipher import CipherFacade, CipherNotFoundError
+from files_service.directory_pipeline import (
+    MANIFEST_NAME,
+    DirectoryPipeline,
+    main,
+)
+
+
+class TestDirectoryPipeline:
+    @pytest.fixture
+    def source_dir(self, tmp_path):
+        source = tmp_path / "source"
+        (source / "nested").mkdir(parents=True)
+        (source / "hello.txt").write_text("Hello World\n", encoding="utf-8")
+        (source / "nested" / "note.txt").write_text("abc\r\nxyz", encoding="utf-8")
+        (source / "nested" / "data.bin").write_bytes(bytes(range(256)))
+        return source
+
+    @pytest.fixture
+    def target_dir(self, tmp_path):
+        return tmp_path / "target"
+
+    def test_init_should_validate_cipher_type_and_operation(self):
+        with pytest.raises(CipherNotFoundError):
+            DirectoryPipeline("rot99")
+        with pytest.raises(ValueError):
+            DirectoryPipeline("rot13", operation="shred")
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_run_should_write_mirrored_tree(self, source_dir, target_dir, workers):
+        report = DirectoryPipeline("rot13", workers=workers).run(
+            str(source_dir), str(target_dir)
+        )
+
+        assert (target_dir / "hello.txt").read_text() == "Uryyb Jbeyq\n"
+        assert (target_dir / "nested" / "note.txt").read_bytes() == b"nop\r\nklm"
+        assert len(report.processed) == 3
+        assert report.total_bytes == 12 + 8 + 256
+        assert not report.failed
+
+    def test_run_should_decrypt_back_to_original_files(
+        self, source_dir, target_dir, tmp_path
+    ):
+        restored_dir = tmp_path / "restored"
+
+        DirectoryPipeline("rot47", chunk_size=7).run(str(source_dir), str(target_dir))
+        report = DirectoryPipeline("rot47", operation="decrypt").run(
+            str(target_dir), str(restored_dir)
+        )
+
+        assert len(report.results) == 3
+        for path in ["hello.txt", "nested/note.txt", "nested/data.bin"]:
+            assert (restored_dir / path).read_bytes() == (
+                source_dir / path
+            ).read_bytes()
+
+    @pytest.mark.parametrize("cipher_type", ["vigenere:lemon", "xor:secret"])
+    def test_run_should_carry_key_position_across_chunks(
+        self, source_dir, target_dir, tmp_path, cipher_type
+    ):
+        restored_dir = tmp_path / "restored"
+
+        DirectoryPipeline(cipher_type, workers=1, chunk_size=3).run(
+            str(source_dir), str(target_dir)
+        )
+        DirectoryPipeline(cipher_type, operation="decrypt", workers=1).run(
+            str(target_dir), str(restored_dir)
+        )
+
+        encrypted = (target_dir / "hello.txt").read_bytes()
+        assert encrypted == CipherFacade().encrypt(b"Hello World\n", cipher_type)
+        for path in ["hello.txt", "nested/note.txt", "nested/data.bin"]:
+            assert (restored_dir / path).read_bytes() == (
+                source_dir / path
+            ).read_bytes()
+
+    def test_run_should_skip_unchanged_files(self, source_dir, target_dir):
+        pipeline = DirectoryPipeline("rot13", workers=1)
+        pipeline.run(str(source_dir), str(target_dir))
+        (source_dir / "hello.txt").write_text("Changed text", encoding="utf-8")
+
+        report = pipeline.run(str(source_dir), str(target_dir))
+
+        assert [result.path for result in report.processed] == ["hello.txt"]
+        assert len(report.skipped) == 2
+        assert (target_dir / "hello.txt").read_text() == "Punatrq grkg"
+
+    def test_run_should_reprocess_files_for_other_cipher(self, source_dir, target_dir):
+        DirectoryPipeline("rot13", workers=1).run(str(source_dir), str(target_dir))
+
+        report = DirectoryPipeline("rot47", workers=1).run(
+            str(source_dir), str(target_dir)
+        )
+
+        assert len(report.processed) == 3
+
+    def test_run_should_reprocess_files_for_other_key(self, source_dir, target_dir):
+        DirectoryPipeline("xor:lemon", workers=1).run(str(source_dir), str(target_dir))
+
+        same_key = DirectoryPipeline("xor:lemon", workers=1).run(
+            str(source_dir), str(target_dir)
+        )
+        other_key = DirectoryPipeline("xor:melon", workers=1).run(
+            str(source_dir), str(target_dir)
+        )
+
+        assert len(same_key.skipped) == 3
+        assert len(other_key.processed) == 3
+
+    def test_manifest_should_not_store_key(self, source_dir, target_dir):
+        DirectoryPipeline("rot13+vigenere:lemon", workers=1).run(
+            str(source_dir), str(target_dir)
+        )
+
+        manifest = (target_dir / MANIFEST_NAME).read_text(encoding="utf-8")
+        assert "lemon" not in manifest
+        assert json.loads(manifest)["cipher_type"] == "rot13+vigenere"
+
+    def test_run_should_skip_target_inside_source(self, source_dir):
+        target_dir = source_dir / "encrypted"
+
+        DirectoryPipeline("rot13", workers=1).run(str(source_dir), str(target_dir))
+        report = DirectoryPipeline("rot13", workers=1).run(
+            str(source_dir), str(target_dir)
+        )
+
+        assert len(report.results) == 3
+        assert (target_dir / MANIFEST_NAME).exists()
+
+    def test_run_should_report_failed_files(self, source_dir, target_dir):
+        with patch(
+            "files_service.directory_pipeline.process_file",
+            side_effect=OSError("disk full"),
+        ):
+            report = DirectoryPipeline("rot13", workers=1).run(
+                str(source_dir), str(target_dir)
+            )
+
+        assert len(report.failed) == 3
+        assert report.failed[0].error == "disk full"
+
+    def test_run_should_not_share_temporary_files(self, source_dir, target_dir):
+        (source_dir / "hello.txt.tmp").write_text("Other text", encoding="utf-8")
+
+        report = DirectoryPipeline("rot13", workers=2).run(
+            str(source_dir), str(target_dir)
+        )
+
+        assert not report.failed
+        assert (target_dir / "hello.txt").read_text(encoding="utf-8") == "Uryyb Jbeyq\n"
+        assert (target_dir / "hello.txt.tmp").read_text(
+            encoding="utf-8"
+        ) == "Bgure grkg"
+
+    def test_process_file_should_remove_temporary_file_on_error(
+        self, source_dir, target_dir
+    ):
+        with patch(
+            "cipher.cipher.CipherStream.update",
+            side_effect=ValueError("broken"),
+        ):
+            report = DirectoryPipeline("rot13", workers=1).run(
+                str(source_dir), str(target_dir)
+            )
+
+        assert len(report.failed) == 3
+        files = [path.name for path in target_dir.rglob("*") if path.is_file()]
+        assert files == [MANIFEST_NAME]
+
+    def test_main_should_display_report(self, source_dir, target_dir):
+        with patch("builtins.print") as mock_print:
+            exit_code = main([str(source_dir), str(target_dir), "--workers", "1"])
+
+        assert exit_code == 0
+        assert mock_print.call_args[0][0].startswith("Processed 3 files")
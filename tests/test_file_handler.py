@@ -5,6 +5,7 @@ import os
 import json
 import pytest
 from files_service.file_handler import FileHandler
+from buffer.buffer import Buffer
 from buffer.text import Text
 
 
@@ -76,7 +77,7 @@ class TestFileHandler:
                     mock_buffer, test_filename_json, "invalid_mode"
                 )
 
-        mock_open.assert_called_once_with(test_filename_json, "a", encoding="utf-8")
+        mock_open.assert_called_once_with(test_filename_json, "ab")
         mock_print.assert_any_call("Invalid mode. Setting up to default 'append' mode.")
 
     def test_save_to_file_should_use_file_not_found_error(
@@ -101,7 +102,7 @@ class TestFileHandler:
             json.dump(test_data, infile)
         try:
             FileHandler.load_from_file(mock_buffer, test_filename_json)
-            mock_buffer.add_bulk.assert_called_once_with(test_data)
+            mock_buffer.add_bulk.assert_called_once_with(test_data["data"])
 
         finally:
             if os.path.exists(test_filename_json):
@@ -140,3 +141,130 @@ class TestFileHandler:
         finally:
             if os.path.exists(test_filename_json):
                 os.remove(test_filename_json)
+
+
+class TestFileHandlerIncrementalSave:
+    @pytest.fixture
+    def buffer(self):
+        buffer = Buffer()
+        buffer.add("text1", "rot13", "encrypted")
+        buffer.add("text2", "rot47", "decrypted")
+        return buffer
+
+    @pytest.fixture
+    def filename(self, tmp_path):
+        return str(tmp_path / "buffer.json")
+
+    @staticmethod
+    def saved_contents(filename):
+        with open(filename, encoding="utf-8") as infile:
+            return [record["content"] for record in json.load(infile)["data"]]
+
+    @staticmethod
+    def save(buffer, filename, mode):
+        with patch("builtins.print"):
+            FileHandler.save_to_file(buffer, filename, mode)
+
+    def test_save_should_write_only_entries_added_since_last_save(
+        self, buffer, filename
+    ):
+        self.save(buffer, filename, "w")
+        buffer.add("text3", "rot13", "encrypted")
+
+        with patch.object(
+            FileHandler, "format_records", wraps=FileHandler.format_records
+        ) as mock_format:
+            self.save(buffer, filename, "w")
+
+        mock_format.assert_called_once_with(
+            [{"content": "text3", "rot_type": "rot13", "status": "encrypted"}]
+        )
+        assert self.saved_contents(filename) == ["text1", "text2", "text3"]
+
+    def test_save_without_new_entries_should_keep_file_valid(self, buffer, filename):
+        self.save(buffer, filename, "w")
+        self.save(buffer, filename, "w")
+
+        assert self.saved_contents(filename) == ["text1", "text2"]
+
+    def test_save_in_write_mode_should_rewrite_file_after_clear(self, buffer, filename):
+        self.save(buffer, filename, "w")
+        buffer.clear_all()
+        buffer.add("text3", "rot13", "encrypted")
+        self.save(buffer, filename, "w")
+
+        assert self.saved_contents(filename) == ["text3"]
+
+    def test_save_in_append_mode_should_append_after_clear(self, buffer, filename):
+        self.save(buffer, filename, "a")
+        buffer.clear_all()
+        buffer.add("text3", "rot13", "encrypted")
+        self.save(buffer, filename, "a")
+
+        assert self.saved_contents(filename) == ["text1", "text2", "text3"]
+
+    def test_save_in_append_mode_should_merge_with_existing_file(
+        self, buffer, filename
+    ):
+        with open(filename, "w", encoding="utf-8") as outfile:
+            record = {"content": "old", "rot_type": "rot13", "status": "encrypted"}
+            json.dump({"data": [record]}, outfile)
+
+        self.save(buffer, filename, "a")
+
+        assert self.saved_contents(filename) == ["old", "text1", "text2"]
+
+    def test_save_in_write_mode_should_rewrite_file_merged_in_append_mode(
+        self, buffer, filename
+    ):
+        with open(filename, "w", encoding="utf-8") as outfile:
+            record = {"content": "old", "rot_type": "rot13", "status": "encrypted"}
+            json.dump({"data": [record]}, outfile)
+
+        self.save(buffer, filename, "a")
+        buffer.add("text3", "rot13", "encrypted")
+        self.save(buffer, filename, "w")
+
+        assert self.saved_contents(filename) == ["text1", "text2", "text3"]
+
+    def test_save_should_rewrite_file_changed_since_last_save(self, buffer, filename):
+        self.save(buffer, filename, "w")
+        with open(filename, "w", encoding="utf-8") as outfile:
+            json.dump({"data": []}, outfile)
+        buffer.add("text3", "rot13", "encrypted")
+
+        self.save(buffer, filename, "w")
+
+        assert self.saved_contents(filename) == ["text1", "text2", "text3"]
+
+    def test_save_should_track_files_separately(self, buffer, tmp_path):
+        first = str(tmp_path / "first.json")
+        second = str(tmp_path / "second.json")
+
+        self.save(buffer, first, "w")
+        buffer.add("text3", "rot13", "encrypted")
+        self.save(buffer, second, "w")
+        self.save(buffer, first, "w")
+
+        assert self.saved_contents(first) == ["text1", "text2", "text3"]
+        assert self.saved_contents(second) == ["text1", "text2", "text3"]
+
+    def test_saved_file_should_load_back_into_buffer(self, buffer, filename):
+        self.save(buffer, filename, "w")
+        buffer.add("text3", "rot13", "encrypted")
+        self.save(buffer, filename, "w")
+        loaded = Buffer()
+
+        FileHandler.load_from_file(loaded, filename)
+
+        assert loaded.storage == buffer.storage
+
+    def test_save_should_keep_pipeline_steps(self, buffer, filename):
+        buffer.add("text3", "rot47+rot13", "encrypted", steps=["rot47", "rot13"])
+        self.save(buffer, filename, "w")
+        loaded = Buffer()
+
+        FileHandler.load_from_file(loaded, filename)
+
+        assert loaded.storage[2].steps == ["rot47", "rot13"]
+        assert "steps" not in FileHandler.text_to_dict(loaded.storage[0])
@@ -0,0 +1,109 @@
+import json
+import pytest
+from unittest.mock import patch, call
+from buffer.buffer import Buffer
+from buffer.text import Text
+from files_service.file_handler import FileHandler
+from files_service.lazy_buffer import LazyBuffer
+
+
+class TestLazyBuffer:
+    @pytest.fixture
+    def buffer(self):
+        buffer = Buffer()
+        for i in range(25):
+            rot_type = "rot13" if i % 3 else "rot47"
+            buffer.add(f'text {i}\n"quoted", 中文', rot_type, "encrypted")
+        return buffer
+
+    @pytest.fixture
+    def filename(self, buffer, tmp_path):
+        filename = str(tmp_path / "buffer.json")
+        with patch("builtins.print"):
+            FileHandler.save_to_file(buffer, filename, "w")
+        return filename
+
+    @pytest.fixture
+    def lazy_buffer(self, filename):
+        with LazyBuffer(filename, page_size=4, cache_pages=2) as lazy_buffer:
+            yield lazy_buffer
+
+    def test_open_should_index_records_without_decoding(self, lazy_buffer):
+        assert len(lazy_buffer) == 25
+        assert len(lazy_buffer.pages) == 0
+
+    def test_getitem_should_return_text(self, lazy_buffer, buffer):
+        assert lazy_buffer[0] == buffer.storage[0]
+        assert lazy_buffer[13] == buffer.storage[13]
+        assert lazy_buffer[-1] == buffer.storage[-1]
+
+    def test_getitem_should_raise_index_error_out_of_range(self, lazy_buffer):
+        with pytest.raises(IndexError):
+            lazy_buffer[25]
+
+    def test_iteration_should_return_all_entries(self, lazy_buffer, buffer):
+        assert list(lazy_buffer) == buffer.storage
+
+    def test_page_cache_should_keep_only_recent_pages(self, lazy_buffer):
+        lazy_buffer[0]
+        lazy_buffer[5]
+        lazy_buffer[0]
+        lazy_buffer[9]
+
+        assert list(lazy_buffer.pages) == [0, 2]
+
+    def test_tail_should_decode_only_last_page(self, lazy_buffer, buffer):
+        assert lazy_buffer.tail(3) == buffer.storage[-3:]
+        assert list(lazy_buffer.pages) == [5, 6]
+
+    def test_filter_should_return_entries_of_cipher_type(self, lazy_buffer, buffer):
+        expected = [text for text in buffer.storage if text.rot_type == "rot47"]
+
+        with patch.object(LazyBuffer, "decode", wraps=LazyBuffer.decode) as mock_decode:
+            result = list(lazy_buffer.filter("rot47"))
+
+        assert result == expected
+        assert mock_decode.call_count == len(expected)
+
+    def test_should_read_incrementally_saved_file(self, buffer, filename):
+        buffer.add("appended", "rot13", "decrypted")
+        with patch("builtins.print"):
+            FileHandler.save_to_file(buffer, filename, "w")
+
+        with LazyBuffer(filename) as lazy_buffer:
+            assert list(lazy_buffer) == buffer.storage
+
+    def test_should_open_empty_file(self, tmp_path):
+        filename = str(tmp_path / "empty.json")
+        with patch("builtins.print"):
+            FileHandler.save_to_file(Buffer(), filename, "w")
+
+        with LazyBuffer(filename) as lazy_buffer:
+            assert len(lazy_buffer) == 0
+            assert lazy_buffer.tail(5) == []
+
+    def test_should_fall_back_to_parsing_other_json_layouts(self, tmp_path):
+        filename = str(tmp_path / "other.json")
+        records = [{"content": "a", "rot_type": "rot13", "status": "encrypted"}]
+        with open(filename, "w", encoding="utf-8") as outfile:
+            json.dump({"data": records}, outfile, indent=2)
+
+        with LazyBuffer(filename) as lazy_buffer:
+            assert list(lazy_buffer) == [Text("a", "rot13", "encrypted")]
+            assert list(lazy_buffer.filter("rot13")) == [
+                Text("a", "rot13", "encrypted")
+            ]
+
+    def test_display_should_print_entries(self, tmp_path):
+        filename = str(tmp_path / "display.json")
+        buffer = Buffer()
+        buffer.add("Hello", "ROT13", "encrypted")
+
+        with patch("builtins.print") as mock_print:
+            FileHandler.save_to_file(buffer, filename, "w")
+            with LazyBuffer(filename) as lazy_buffer:
+                lazy_buffer.display()
+
+        mock_print.assert_has_calls(
+            [call("Buffer content:"), call("1. ROT:[ROT13], STATUS[encrypted]: Hello")]
+        )
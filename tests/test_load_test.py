@@ -0,0 +1,52 @@
+import json
+from unittest.mock import patch
+from benchmarks.load_test import build_script, main, run_load_test
+
+
+class TestLoadTest:
+    def test_build_script_should_be_reproducible_and_end_with_exit(self, tmp_path):
+        script = build_script(200, 1, str(tmp_path))
+
+        assert script == build_script(200, 1, str(tmp_path))
+        assert script[-1] == "7"
+
+    def test_build_script_should_not_ask_for_filename_on_empty_buffer(
+        self, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr("benchmarks.load_test.OPERATION_WEIGHTS", {"save": 1})
+
+        assert build_script(3, 0, str(tmp_path)) == ["5", "5", "5", "7"]
+
+    def test_run_load_test_should_drive_real_manager(self, tmp_path):
+        report = run_load_test(300, seed=2, directory=str(tmp_path))
+
+        stats = report.action_stats()
+        assert report.operations == 301
+        assert stats["exit_program"]["count"] == 1
+        assert stats["encrypt_text"]["count"] > 100
+        assert len(report.buffer_sizes) == report.operations
+        assert max(report.buffer_sizes) > 0
+        assert report.file_sizes
+        assert all(size > 0 for size in report.file_sizes.values())
+
+    def test_run_load_test_should_remove_temporary_directory(self, tmp_path):
+        with patch("tempfile.tempdir", str(tmp_path)):
+            report = run_load_test(100, seed=2)
+
+        assert report.file_sizes
+        assert list(tmp_path.iterdir()) == []
+
+    def test_main_should_save_and_compare_results(self, tmp_path, capsys):
+        output = tmp_path / "load.json"
+        directory = tmp_path / "files"
+        directory.mkdir()
+
+        arguments = ["--operations", "50", "--directory", str(directory)]
+        assert main(arguments + ["--output", str(output)]) == 0
+
+        results = json.loads(output.read_text())
+        assert "load.encrypt_text" in results["results"]
+        assert "load.loop_overhead" in results["results"]
+
+        main(arguments + ["--baseline", str(output), "--threshold", "1000000"])
+        assert "No regressions" in capsys.readouterr().out
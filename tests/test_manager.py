@@ -91,7 +91,7 @@ class TestManager:
             manager.encrypt_text()
 
             manager.buffer.add.assert_called_once_with(
-                content=ANY, rot_type="rot13", status="encrypted"
+                content=ANY, rot_type="rot13", status="encrypted", steps=None
             )
 
     def test_make_cipher_operation_should_decrypt_text(
@@ -104,9 +104,42 @@ class TestManager:
             manager.decrypt_text()
 
             manager.buffer.add.assert_called_once_with(
-                content=ANY, rot_type="rot13", status="decrypted"
+                content=ANY, rot_type="rot13", status="decrypted", steps=None
             )
 
+    def test_encrypt_text_should_record_pipeline_steps(self, manager, mock_buffer):
+        manager.cipher_facade = CipherFacade()
+        mock_buffer.add = Mock()
+
+        with patch("builtins.input", side_effect=["hello", "rot47+rot13"]):
+            with patch("builtins.print"):
+                manager.encrypt_text()
+
+        manager.buffer.add.assert_called_once_with(
+            content=CipherFacade().encrypt(
+                CipherFacade().encrypt("hello", "rot47"), "rot13"
+            ),
+            rot_type="rot47+rot13",
+            status="encrypted",
+            steps=["rot47", "rot13"],
+        )
+
+    @pytest.mark.parametrize("cipher_type", ["vigenere:lemon", "rot13+xor:lemon"])
+    def test_saving_keyed_entry_should_not_write_key(self, tmp_path, cipher_type):
+        buffer = Buffer()
+        manager = Manager(CipherFacade(), buffer, FileHandler(), MainMenu())
+        filename = str(tmp_path / "buffer.json")
+
+        with patch("builtins.input", side_effect=["attack", cipher_type]):
+            with patch("builtins.print"):
+                manager.encrypt_text()
+                FileHandler.save_to_file(buffer, filename, "w")
+
+        with open(filename, encoding="utf-8") as infile:
+            saved = infile.read()
+        assert "lemon" not in saved
+        assert "lemon" not in str(buffer.storage)
+
     def test_make_cipher_operation_should_use_error_cipher_not_found(
         self, manager, mock_cipher_facade
     ):
@@ -207,6 +240,9 @@ class TestManager:
         mock_print.assert_called_once_with("\nExiting application. Goodbye!")
         assert manager.is_running == False
 
+    def test_actions_should_be_built_once(self, manager):
+        assert manager.actions is manager.actions
+
     def test_run_should_execute_action_based_on_menu_choice(self, manager, mock_menu):
         manager.menu.get_choice.side_effect = [1, 7]
         with patch.object(manager, "encrypt_text") as mock_encrypt_text:
@@ -214,6 +250,18 @@ class TestManager:
 
         mock_encrypt_text.assert_called_once()
 
+    def test_run_should_use_profiler_when_enabled(self, manager, mock_menu):
+        manager.profiler = Mock()
+        manager.profiler.run.side_effect = lambda action: action()
+        manager.menu.get_choice.side_effect = [3, 7]
+
+        with patch("builtins.print"):
+            manager.run()
+
+        manager.profiler.run.assert_has_calls(
+            [call(manager.display_buffer), call(manager.exit_program)]
+        )
+
     def test_run_should_handle_invalid_choice(self, manager, mock_menu):
         manager.menu.get_choice.side_effect = [9, 7]
         with patch("builtins.print") as mock_print:
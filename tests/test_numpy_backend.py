@@ -0,0 +1,45 @@
+import pytest
+from unittest.mock import patch
+from cipher import numpy_backend
+from cipher.cipher import CipherROT13, CipherROT47, ascii_table
+from benchmarks.suite import sample_text
+
+pytest.importorskip("numpy")
+
+
+class TestNumpyBackend:
+    @pytest.mark.parametrize(
+        "cipher,shift", [(CipherROT13(), 13), (CipherROT13(), 5), (CipherROT47(), 47)]
+    )
+    def test_translate_should_match_python_implementation(self, cipher, shift):
+        text = sample_text("ascii", 5000) + "".join(chr(i) for i in range(128))
+
+        result = numpy_backend.translate(text, ascii_table(type(cipher), shift))
+
+        assert result == cipher.python_shift(text, shift)
+
+    @pytest.mark.parametrize("cipher", [CipherROT13(), CipherROT47()])
+    def test_perform_shift_should_not_pick_numpy(self, cipher):
+        text = sample_text("ascii", 5000)
+
+        with patch("cipher.numpy_backend.get_numpy") as mock_get_numpy:
+            cipher.encrypt(text)
+
+        mock_get_numpy.assert_not_called()
+
+    def test_is_available_should_be_false_without_numpy(self):
+        with patch("cipher.numpy_backend.get_numpy", return_value=None):
+            assert not numpy_backend.is_available()
+
+    def test_translate_buffer_should_translate_in_place(self):
+        data = bytearray(b"Hello World!")
+
+        numpy_backend.translate_buffer(data, ascii_table(CipherROT13, 13))
+
+        assert data == bytearray(b"Uryyb Jbeyq!")
+
+    def test_ascii_table_should_keep_non_ascii_bytes(self):
+        table = ascii_table(CipherROT47, 47)
+
+        assert len(table) == 256
+        assert table[128:] == bytes(range(128, 256))
@@ -0,0 +1,113 @@
+import io
+import pytest
+from cipher.cipher import CipherFacade, CipherNotFoundError, CipherVigenere, CipherXOR
+from cipher.pipeline import CipherPipeline, TranslationCipher, compose_tables
+
+
+class TestCipherPipeline:
+    @pytest.fixture
+    def cipher_facade(self):
+        return CipherFacade()
+
+    @pytest.fixture
+    def text(self):
+        return "Hello World! 123 ~{} Zażółć Straße 😀 ✓"
+
+    def chain(self, cipher_facade, text, cipher_types, operation="encrypt"):
+        for cipher_type in cipher_types:
+            text = getattr(cipher_facade, operation)(text, cipher_type)
+        return text
+
+    @pytest.mark.parametrize(
+        "cipher_types",
+        [
+            ["rot47", "rot13"],
+            ["rot13", "rot47", "rot13"],
+            ["rot13", "vigenere:lemon", "rot47"],
+            ["xor:key", "rot13", "rot47", "vigenere:abc"],
+        ],
+    )
+    def test_pipeline_should_match_chained_ciphers(
+        self, cipher_facade, text, cipher_types
+    ):
+        pipeline = cipher_facade.pipeline(*cipher_types)
+        encrypted = pipeline.encrypt(text)
+
+        assert encrypted == self.chain(cipher_facade, text, cipher_types)
+        assert pipeline.decrypt(encrypted) == text
+
+    def test_pipeline_should_fuse_consecutive_table_ciphers(self, cipher_facade):
+        pipeline = cipher_facade.pipeline("rot47", "rot13", "vigenere:key", "rot13")
+
+        assert [type(stage) for stage in pipeline.stages] == [
+            TranslationCipher,
+            CipherVigenere,
+            TranslationCipher,
+        ]
+        assert pipeline.steps == ["rot47", "rot13", "vigenere", "rot13"]
+        assert pipeline.name == "rot47+rot13+vigenere+rot13"
+
+    def test_pipeline_should_encrypt_bytes(self, cipher_facade):
+        pipeline = cipher_facade.pipeline("rot47", "rot13", "xor:k")
+        expected = cipher_facade.encrypt(
+            self.chain(cipher_facade, "Hello", ["rot47", "rot13"]).encode(), "xor:k"
+        )
+
+        assert pipeline.supports_bytes
+        assert pipeline.encrypt(b"Hello") == expected
+        assert pipeline.decrypt(expected) == b"Hello"
+
+    def test_pipeline_stream_should_match_bulk_encryption(self, cipher_facade, text):
+        pipeline = cipher_facade.pipeline("rot13", "vigenere:lemon", "rot47")
+        source = io.StringIO(text)
+        stream = pipeline.stream()
+
+        result = "".join(
+            stream.update(chunk) for chunk in iter(lambda: source.read(4), "")
+        )
+
+        assert result == pipeline.encrypt(text)
+
+    def test_pipeline_stream_should_decrypt(self, cipher_facade, text):
+        pipeline = cipher_facade.pipeline("vigenere:lemon", "rot13", "xor:ab")
+        encrypted = pipeline.encrypt(text)
+        stream = pipeline.stream(decrypt=True)
+
+        result = stream.update(encrypted[:5]) + stream.update(encrypted[5:])
+
+        assert result == text
+
+    def test_check_cipher_type_should_build_pipeline_from_plus_syntax(
+        self, cipher_facade
+    ):
+        cipher = cipher_facade.check_cipher_type("ROT47+rot13")
+
+        assert isinstance(cipher, CipherPipeline)
+        assert cipher.steps == ["ROT47", "rot13"]
+
+    def test_pipeline_should_raise_error_for_unknown_step(self, cipher_facade):
+        with pytest.raises(CipherNotFoundError):
+            cipher_facade.pipeline("rot47", "rot99")
+
+    @pytest.mark.parametrize(
+        "cipher_type,cipher_types",
+        [
+            ("xor:se+cret", ["xor:se+cret"]),
+            ("rot13+xor:a+b+rot47", ["rot13", "xor:a+b", "rot47"]),
+            ("vigenere:key+Rot13", ["vigenere:key", "Rot13"]),
+            ("rot13+rot99", ["rot13", "rot99"]),
+        ],
+    )
+    def test_split_cipher_type_should_keep_plus_in_keys(
+        self, cipher_facade, cipher_type, cipher_types
+    ):
+        assert cipher_facade.split_cipher_type(cipher_type) == cipher_types
+
+    def test_keyed_cipher_should_accept_key_with_plus(self, cipher_facade):
+        cipher = cipher_facade.check_cipher_type("xor:se+cret")
+
+        assert cipher.key == "se+cret"
+        assert cipher.encrypt("text") == CipherXOR("se+cret").encrypt("text")
+
+    def test_compose_tables_should_drop_identity_mappings(self):
+        assert compose_tables({97: 98}, {98: 97, 99: 100}) == {98: 97, 99: 100}
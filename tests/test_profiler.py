@@ -0,0 +1,93 @@
+import os
+import pstats
+import pytest
+import tracemalloc
+from unittest.mock import patch
+from manager.profiler import ActionProfiler
+from settings import Settings
+
+
+class TestActionProfiler:
+    @pytest.fixture
+    def profiler(self, tmp_path):
+        return ActionProfiler(output_dir=str(tmp_path / "profiles"), top=5)
+
+    def test_run_should_call_action(self, profiler):
+        calls = []
+
+        with patch("builtins.print"):
+            profiler.run(lambda: calls.append(1))
+
+        assert calls == [1]
+
+    def test_run_should_write_prof_and_allocation_report(self, profiler):
+        def save_to_file():
+            return [str(i) for i in range(1000)]
+
+        with patch("builtins.print"):
+            profiler.run(save_to_file)
+
+        files = sorted(os.listdir(profiler.output_dir))
+        assert len(files) == 2
+        assert files[0].startswith("save_to_file-")
+        assert files[0].endswith(".alloc.txt")
+        assert files[1].endswith(".prof")
+
+        stats = pstats.Stats(os.path.join(profiler.output_dir, files[1]))
+        assert any(func[2] == "save_to_file" for func in stats.stats)
+
+        with open(os.path.join(profiler.output_dir, files[0]), encoding="utf-8") as f:
+            report = f.read()
+        assert "Action: save_to_file" in report
+        assert "Top 5 allocations:" in report
+
+    def test_run_should_save_reports_when_action_fails(self, profiler):
+        def failing_action():
+            raise ValueError("boom")
+
+        with patch("builtins.print"):
+            with pytest.raises(ValueError):
+                profiler.run(failing_action)
+
+        assert len(os.listdir(profiler.output_dir)) == 2
+
+    def test_run_should_report_peak_of_action_when_already_tracing(self, profiler):
+        tracemalloc.start()
+        try:
+            large = bytearray(10 * 1024 * 1024)
+            del large
+            with patch("builtins.print"):
+                profiler.run(lambda: None)
+        finally:
+            tracemalloc.stop()
+
+        (report_name,) = [
+            name for name in os.listdir(profiler.output_dir) if name.endswith(".txt")
+        ]
+        with open(
+            os.path.join(profiler.output_dir, report_name), encoding="utf-8"
+        ) as f:
+            peak_line = f.read().splitlines()[2]
+        assert peak_line.startswith("Peak memory:")
+        assert float(peak_line.split()[2]) < 5 * 1024
+
+    def test_run_should_skip_disabled_reports(self, tmp_path):
+        profiler = ActionProfiler(output_dir=str(tmp_path), memory=False)
+
+        with patch("builtins.print"):
+            profiler.run(lambda: None)
+
+        assert [name[-5:] for name in os.listdir(tmp_path)] == [".prof"]
+
+    def test_from_settings_should_return_none_when_profiling_disabled(self):
+        with patch("manager.profiler.get_settings", return_value=Settings()):
+            assert ActionProfiler.from_settings() is None
+
+    def test_from_settings_should_use_configured_directory(self):
+        settings = Settings(profile=True, profile_dir="out", profile_top=3)
+
+        with patch("manager.profiler.get_settings", return_value=settings):
+            profiler = ActionProfiler.from_settings()
+
+        assert profiler.output_dir == "out"
+        assert profiler.top == 3
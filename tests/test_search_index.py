@@ -0,0 +1,106 @@
+import pytest
+from buffer.buffer import Buffer
+from buffer.search_index import SearchIndex, TokenTable
+from cipher.cipher import CipherFacade
+
+
+class TestSearchIndex:
+    @pytest.fixture
+    def cipher_facade(self):
+        return CipherFacade()
+
+    @pytest.fixture
+    def buffer(self):
+        return Buffer()
+
+    @pytest.fixture
+    def index(self, cipher_facade, buffer):
+        index = SearchIndex(cipher_facade)
+        index.attach(buffer)
+        return index
+
+    def add_encrypted(self, cipher_facade, buffer, text, cipher_type):
+        buffer.add(cipher_facade.encrypt(text, cipher_type), cipher_type, "encrypted")
+
+    def test_token_table_should_split_lowercase_words(self):
+        assert TokenTable().tokens("Hello, World! 123 Zażółć") == [
+            "hello",
+            "world",
+            "123",
+            "zażółć",
+        ]
+
+    def test_token_table_should_split_ciphertext_by_plaintext_words(
+        self, cipher_facade
+    ):
+        cipher = cipher_facade.check_cipher_type("rot47")
+        tokens = TokenTable(
+            cipher.translation_table(), cipher.translation_table(decrypt=True)
+        )
+
+        ciphertext = cipher.encrypt("Hello, World!")
+
+        assert tokens.tokens(ciphertext) == [
+            cipher.encrypt("hello"),
+            cipher.encrypt("world"),
+        ]
+
+    def test_search_should_find_plaintext_entries(self, index, buffer):
+        buffer.add("Hello World", "rot13", "decrypted")
+        buffer.add("Goodbye world", "rot13", "decrypted")
+
+        assert index.search("world") == [0, 1]
+        assert index.search("HELLO world") == [0]
+        assert index.search("missing") == []
+        assert index.search("!!!") == []
+
+    @pytest.mark.parametrize("cipher_type", ["rot13", "rot47", "rot47+rot13"])
+    def test_search_should_find_plaintext_word_in_encrypted_entries(
+        self, index, cipher_facade, buffer, cipher_type
+    ):
+        buffer.add("Other text", "rot13", "decrypted")
+        self.add_encrypted(cipher_facade, buffer, "Say Hello, World!", cipher_type)
+
+        assert index.search("hello") == [1]
+        assert index.search("world say") == [1]
+        assert index.search("other") == [0]
+
+    def test_search_should_find_ciphertext_words(self, index, cipher_facade, buffer):
+        buffer.add("Hello World", "rot47", "decrypted")
+        self.add_encrypted(cipher_facade, buffer, "Hello there", "rot47")
+        self.add_encrypted(cipher_facade, buffer, "Hello there", "vigenere:key")
+
+        assert index.search(cipher_facade.encrypt("hello", "rot47"), True) == [0, 1]
+        ciphertext_word = buffer.storage[2].content.split()[0]
+        assert index.search(ciphertext_word, ciphertext=True) == [2]
+
+    def test_search_should_skip_plaintext_of_keyed_cipher_entries(
+        self, index, cipher_facade, buffer
+    ):
+        self.add_encrypted(cipher_facade, buffer, "Hello there", "xor:key")
+
+        assert index.search("hello") == []
+
+    def test_index_should_follow_bulk_add_and_clear(self, index, buffer):
+        buffer.add_bulk(
+            [
+                {"content": "first entry", "rot_type": "rot13", "status": "decrypted"},
+                {"content": "second entry", "rot_type": "rot13", "status": "decrypted"},
+            ]
+        )
+        assert index.search("entry") == [0, 1]
+
+        buffer.clear_all()
+        assert index.search("entry") == []
+
+        buffer.add("third entry", "rot13", "decrypted")
+        assert index.search("entry") == [0]
+
+    def test_attach_should_index_existing_entries(self, cipher_facade):
+        buffer = Buffer()
+        buffer.add("already there", "rot13", "decrypted")
+
+        index = SearchIndex(cipher_facade)
+        index.attach(buffer)
+
+        assert index.search("there") == [0]
@@ -0,0 +1,127 @@
+import csv
+import io
+import json
+import os
+import socket
+import tracemalloc
+import pytest
+from buffer.buffer import Buffer
+from files_service.file_handler import FileHandler
+from files_service.lazy_buffer import LazyBuffer
+from files_service.serializers import export, iter_json, main
+
+
+class TestSerializers:
+    @pytest.fixture
+    def buffer(self):
+        buffer = Buffer()
+        buffer.add("text1", "rot13", "encrypted")
+        buffer.add('quoted "text", 2', "rot47", "decrypted")
+        buffer.add("text3", "rot47+rot13", "encrypted", steps=["rot47", "rot13"])
+        return buffer
+
+    def exported(self, buffer, format):
+        output = io.BytesIO()
+        written = export(buffer.storage, output, format)
+
+        assert written == len(output.getvalue())
+        return output.getvalue().decode("utf-8")
+
+    def test_json_export_should_match_saved_file(self, buffer, tmp_path):
+        filename = str(tmp_path / "buffer.json")
+        FileHandler.write_records(
+            filename, FileHandler.buffer_to_dict(buffer), mode="w"
+        )
+
+        with open(filename, encoding="utf-8") as infile:
+            assert self.exported(buffer, "json") == infile.read()
+
+    def test_json_export_should_match_incrementally_saved_file(self, buffer, tmp_path):
+        filename = str(tmp_path / "buffer.json")
+        saved = Buffer()
+        for text in buffer.storage:
+            saved.add(text.content, text.rot_type, text.status, steps=text.steps)
+            FileHandler.save_to_file(saved, filename, "w")
+
+        with open(filename, encoding="utf-8") as infile:
+            assert self.exported(buffer, "json") == infile.read()
+
+    def test_json_export_of_empty_buffer_should_be_valid(self):
+        assert json.loads(self.exported(Buffer(), "json")) == {"data": []}
+
+    def test_jsonl_export_should_write_record_per_line(self, buffer):
+        lines = self.exported(buffer, "jsonl").splitlines()
+
+        assert [json.loads(line) for line in lines] == FileHandler.buffer_to_dict(
+            buffer
+        )
+
+    def test_csv_export_should_write_header_and_rows(self, buffer):
+        rows = list(csv.reader(io.StringIO(self.exported(buffer, "csv"))))
+
+        assert rows == [
+            ["content", "rot_type", "status", "steps"],
+            ["text1", "rot13", "encrypted", ""],
+            ['quoted "text", 2', "rot47", "decrypted", ""],
+            ["text3", "rot47+rot13", "encrypted", "rot47+rot13"],
+        ]
+
+    def test_export_should_reject_unknown_format(self, buffer):
+        with pytest.raises(ValueError):
+            export(buffer.storage, io.BytesIO(), "xml")
+
+    def test_serializer_should_yield_chunks_of_fixed_size(self):
+        records = [{"content": "x" * 10} for _ in range(100)]
+
+        chunks = list(iter_json(records, chunk_size=100))
+
+        assert len(chunks) > 10
+        assert all(len(chunk) < 200 for chunk in chunks)
+
+    def test_export_should_send_to_socket(self, buffer):
+        sender, receiver = socket.socketpair()
+        with sender, receiver:
+            written = export(buffer.storage, sender, "jsonl")
+            sender.shutdown(socket.SHUT_WR)
+            received = b""
+            while data := receiver.recv(4096):
+                received += data
+
+        assert len(received) == written
+        assert len(received.splitlines()) == 3
+
+    def test_export_memory_should_not_grow_with_buffer(self):
+        buffer = Buffer()
+        buffer.add_bulk(
+            [
+                {"content": f"text {i}" * 10, "rot_type": "rot13", "status": "x"}
+                for i in range(20000)
+            ]
+        )
+
+        with open(os.devnull, "wb") as sink:
+            tracemalloc.start()
+            try:
+                written = export(buffer.storage, sink, "json", chunk_size=64 * 1024)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+        assert written > 20 * 64 * 1024
+        assert peak < written / 4
+
+    def test_main_should_export_saved_file_to_stdout(
+        self, buffer, tmp_path, capsysbinary
+    ):
+        filename = str(tmp_path / "buffer.json")
+        FileHandler.write_records(
+            filename, FileHandler.buffer_to_dict(buffer), mode="w"
+        )
+
+        assert main([filename, "--format", "jsonl"]) == 0
+
+        lines = capsysbinary.readouterr().out.splitlines()
+        with LazyBuffer(filename) as saved:
+            assert [json.loads(line)["content"] for line in lines] == [
+                text.content for text in saved
+            ]
@@ -0,0 +1,86 @@
+import os
+import subprocess
+import sys
+import pytest
+from unittest.mock import patch
+import settings
+from settings import Settings, get_settings, parse_bool, parse_int, parse_list
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestSettings:
+    @pytest.fixture(autouse=True)
+    def clear_settings_cache(self):
+        get_settings.cache_clear()
+        yield
+        get_settings.cache_clear()
+
+    @pytest.mark.parametrize(
+        "value,result",
+        [("True", True), ("1", True), ("yes", True), ("False", False), ("0", False)],
+    )
+    def test_parse_bool_should_parse_strings(self, value, result):
+        assert parse_bool(value) is result
+
+    def test_parse_bool_should_return_default_for_missing_value(self):
+        assert parse_bool(None) is False
+        assert parse_bool("", default=True) is True
+
+    def test_parse_int_should_fall_back_to_default_for_invalid_value(self):
+        assert parse_int("8", 1) == 8
+        assert parse_int("eight", 1) == 1
+        assert parse_int("-3", 1) == 1
+
+    def test_parse_list_should_split_comma_separated_value(self):
+        assert parse_list("αβγ, абв,,") == ("αβγ", "абв")
+        assert parse_list(None) == ()
+
+    def test_from_env_should_read_environment(self):
+        env = {"DEBUG": "False", "WORKERS": "3", "CHUNK_SIZE": "1024"}
+
+        with patch.dict(os.environ, env):
+            result = Settings.from_env()
+
+        assert result.debug is False
+        assert result.workers == 3
+        assert result.chunk_size == 1024
+        assert result.cache_size == Settings.cache_size
+
+    def test_get_settings_should_load_settings_once(self):
+        with patch("settings.load_env_file") as mock_load:
+            first = get_settings()
+            second = get_settings()
+
+        assert first is second
+        mock_load.assert_called_once_with()
+
+    def test_debug_attribute_should_be_read_lazily(self):
+        with patch.dict(os.environ, {"DEBUG": "true"}):
+            with patch("settings.load_env_file"):
+                assert settings.DEBUG is True
+
+    def test_import_and_facade_should_not_load_dotenv_numpy_or_print(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-X",
+                "importtime",
+                "-c",
+                "import settings, cipher.cipher, manager.manager; "
+                "cipher.cipher.CipherFacade().encrypt('text', 'rot13')",
+            ],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        imported = [
+            line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines()
+        ]
+
+        assert result.stdout == ""
+        assert "dotenv" not in imported
+        assert "numpy" not in imported
+        assert "settings" in imported